@@ -39,6 +39,7 @@ from ouroboros.config import (
     HOME, APP_ROOT, REPO_DIR, DATA_DIR, SETTINGS_PATH, PID_FILE, PORT_FILE,
     RESTART_EXIT_CODE, PANIC_EXIT_CODE, AGENT_SERVER_PORT,
     read_version, load_settings, save_settings, acquire_pid_lock, release_pid_lock,
+    parse_budget,
 )
 MAX_CRASH_RESTARTS = 5
 CRASH_WINDOW_SEC = 120
@@ -402,7 +403,7 @@ def _migrate_old_settings() -> None:
         if val:
             try:
                 if key in ("TOTAL_BUDGET",):
-                    migrated[key] = float(val)
+                    migrated[key] = parse_budget(val)
                 elif key in ("OUROBOROS_MAX_WORKERS", "OUROBOROS_SOFT_TIMEOUT_SEC", "OUROBOROS_HARD_TIMEOUT_SEC"):
                     migrated[key] = int(val)
                 else:
@@ -259,7 +259,7 @@ def verify_restart(env: Any, git_sha: str) -> None:
         except (FileNotFoundError, Exception):
             return
         try:
-            claim_data = json.loads(read_text(claim_path))
+            claim_data = json.loads(claim_path.read_bytes())
             expected_sha = str(claim_data.get("expected_sha", "")).strip()
             ok = bool(expected_sha and expected_sha == git_sha)
             append_jsonl(env.drive_path('logs') / 'events.jsonl', {
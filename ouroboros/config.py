@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import os
 import pathlib
+import re
 import sys
 import time
 from typing import Optional
@@ -106,6 +107,22 @@ def resolve_effort(task_type: str) -> str:
     return raw if raw in _VALID_EFFORTS else default
 
 
+_BUDGET_CLEAN_RE = re.compile(r"[^0-9.\-]")
+
+
+def parse_budget(raw, default: float = 10.0) -> float:
+    """Parse a TOTAL_BUDGET value, tolerating strings like "$10" or "10 USD"."""
+    if raw is None or raw == "":
+        return default
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        return float(raw)
+    cleaned = _BUDGET_CLEAN_RE.sub("", str(raw))
+    try:
+        return float(cleaned)
+    except ValueError:
+        return default
+
+
 def get_review_models() -> list[str]:
     """Return the configured pre-commit review model list."""
     default_str = SETTINGS_DEFAULTS["OUROBOROS_REVIEW_MODELS"]
@@ -123,13 +140,24 @@ def get_review_enforcement() -> str:
 # ---------------------------------------------------------------------------
 # Version
 # ---------------------------------------------------------------------------
+_VERSION_CACHE: Optional[tuple] = None  # (st_mtime_ns, st_size, version)
+
+
 def read_version() -> str:
+    """Return the VERSION file contents, re-reading only when the file changes."""
+    global _VERSION_CACHE
     try:
         if getattr(sys, "frozen", False):
             vp = pathlib.Path(sys._MEIPASS) / "VERSION"
         else:
             vp = pathlib.Path(__file__).parent.parent / "VERSION"
-        return vp.read_text(encoding="utf-8").strip()
+        st = vp.stat()
+        cached = _VERSION_CACHE
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        version = vp.read_text(encoding="utf-8").strip()
+        _VERSION_CACHE = (st.st_mtime_ns, st.st_size, version)
+        return version
     except Exception:
         return "0.0.0"
 
@@ -219,16 +247,17 @@ def apply_settings_to_env(settings: dict) -> None:
         "LOCAL_MODEL_CHAT_FORMAT",
         "USE_LOCAL_MAIN", "USE_LOCAL_CODE", "USE_LOCAL_LIGHT", "USE_LOCAL_FALLBACK",
     ]
+    env = {}
     for k in env_keys:
         val = settings.get(k)
         if val is None or val == "":
             os.environ.pop(k, None)
         else:
-            os.environ[k] = str(val)
-    if not os.environ.get("OUROBOROS_REVIEW_MODELS"):
-        os.environ["OUROBOROS_REVIEW_MODELS"] = str(SETTINGS_DEFAULTS["OUROBOROS_REVIEW_MODELS"])
-    if not os.environ.get("OUROBOROS_REVIEW_ENFORCEMENT"):
-        os.environ["OUROBOROS_REVIEW_ENFORCEMENT"] = str(SETTINGS_DEFAULTS["OUROBOROS_REVIEW_ENFORCEMENT"])
+            env[k] = str(val)
+    for k in ("OUROBOROS_REVIEW_MODELS", "OUROBOROS_REVIEW_ENFORCEMENT"):
+        if not env.get(k):
+            env[k] = str(SETTINGS_DEFAULTS[k])
+    os.environ.update(env)
 
 
 # ---------------------------------------------------------------------------
@@ -13,9 +13,9 @@ import os
 import pathlib
 import sys
 from collections import Counter
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from ouroboros.utils import utc_now_iso, read_text, write_text, append_jsonl, short
+from ouroboros.utils import utc_now_iso, read_text, write_text, append_jsonl, short, tail_lines
 
 if sys.platform == "win32":
     import msvcrt
@@ -48,6 +48,20 @@ log = logging.getLogger(__name__)
 _SCRATCHPAD_MAX_BLOCKS = 10
 
 
+def _iter_json_objects(lines: Iterable[str], where: str) -> Iterator[Dict[str, Any]]:
+    """Lazily decode JSONL lines, skipping blanks and anything that is not a JSON object."""
+    for line in lines:
+        line = line.strip()
+        if line[:1] != "{":
+            if line:
+                log.debug(f"Skipping non-object line in {where}: {line[:100]}")
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            log.debug(f"Failed to parse JSON line in {where}: {line[:100]}")
+
+
 class Memory:
     """Ouroboros memory management: scratchpad, identity, chat history, logs."""
 
@@ -270,17 +284,20 @@ class Memory:
             return "(chat history is empty)"
 
         try:
-            raw_lines = chat_path.read_text(encoding="utf-8").strip().split("\n")
-            entries = []
-            for line in raw_lines:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entries.append(json.loads(line))
-                except Exception:
-                    log.debug(f"Failed to parse JSON line in chat_history: {line[:100]}")
-                    continue
+            if search or count <= 0:
+                raw_lines = chat_path.read_text(encoding="utf-8").split("\n")
+                entries = list(_iter_json_objects(raw_lines, "chat_history"))
+            else:
+                # Only the newest count+offset records can be shown — skip parsing the rest.
+                # Unparseable lines don't count toward the page, so widen the tail until
+                # enough records are found or the whole file has been read.
+                want = n_lines = count + offset
+                while True:
+                    raw_lines = tail_lines(chat_path, n_lines)
+                    entries = list(_iter_json_objects(raw_lines, "chat_history"))
+                    if len(entries) >= want or len(raw_lines) < n_lines:
+                        break
+                    n_lines *= 2
 
             if search:
                 search_lower = search.lower()
@@ -317,22 +334,10 @@ class Memory:
     def read_jsonl_tail(self, log_name: str, max_entries: int = 100) -> List[Dict[str, Any]]:
         """Read the last max_entries records from a JSONL file."""
         path = self.logs_path(log_name)
-        if not path.exists():
-            return []
         try:
-            lines = path.read_text(encoding="utf-8").strip().split("\n")
-            tail = lines[-max_entries:] if max_entries < len(lines) else lines
-            entries = []
-            for line in tail:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entries.append(json.loads(line))
-                except Exception:
-                    log.debug(f"Failed to parse JSON line in read_jsonl_tail: {line[:100]}", exc_info=True)
-                    continue
-            return entries
+            return list(_iter_json_objects(tail_lines(path, max_entries), "read_jsonl_tail"))
+        except FileNotFoundError:
+            return []
         except Exception:
             log.warning(f"Failed to read JSONL tail from {log_name}", exc_info=True)
             return []
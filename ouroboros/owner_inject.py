@@ -12,9 +12,10 @@ messages for their own task_id on each LLM round.
 import datetime
 import json
 import logging
+import os
 import pathlib
 import uuid
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 log = logging.getLogger(__name__)
 
@@ -101,3 +102,22 @@ def cleanup_task_mailbox(drive_root: pathlib.Path, task_id: str) -> None:
             path.unlink()
     except Exception:
         log.debug("Failed to cleanup mailbox for task %s", task_id, exc_info=True)
+
+
+def clear_stale_mailboxes(drive_root: pathlib.Path, keep_task_ids: Iterable[str] = ()) -> None:
+    """Drop mailboxes of tasks that did not survive a restart (and the legacy pending file).
+
+    Tasks restored from the queue snapshot keep their mailbox, so owner
+    messages they have not drained yet are still delivered when they run.
+    """
+    mailbox_dir = drive_root / _MAILBOX_DIR
+    keep = {_mailbox_path(drive_root, str(tid)).name for tid in keep_task_ids}
+    try:
+        mailbox_dir.mkdir(parents=True, exist_ok=True)
+        with os.scandir(mailbox_dir) as it:
+            for entry in it:
+                if entry.name not in keep and entry.is_file(follow_symlinks=False):
+                    os.unlink(entry.path)
+        get_pending_path(drive_root).unlink(missing_ok=True)
+    except Exception:
+        log.debug("Failed to clear stale owner mailboxes", exc_info=True)
@@ -20,7 +20,7 @@ from ouroboros.task_results import (
     write_task_result,
 )
 from ouroboros.tools.registry import ToolContext, ToolEntry
-from ouroboros.utils import utc_now_iso, write_text, run_cmd
+from ouroboros.utils import utc_now_iso, write_text, get_git_info
 
 log = logging.getLogger(__name__)
 
@@ -32,13 +32,14 @@ def _request_restart(ctx: ToolContext, reason: str) -> str:
         return "⚠️ RESTART_BLOCKED: in evolution mode, commit+push first."
     # Persist expected SHA for post-restart verification
     try:
-        sha = run_cmd(["git", "rev-parse", "HEAD"], cwd=ctx.repo_dir)
-        branch = run_cmd(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=ctx.repo_dir)
-        verify_path = ctx.drive_path("state") / "pending_restart_verify.json"
-        write_text(verify_path, json.dumps({
-            "ts": utc_now_iso(), "expected_sha": sha,
-            "expected_branch": branch, "reason": reason,
-        }, ensure_ascii=False, indent=2))
+        # HEAD-fingerprint cached lookup: usually no git subprocess at all here
+        branch, sha = get_git_info(ctx.repo_dir)
+        if sha:
+            verify_path = ctx.drive_path("state") / "pending_restart_verify.json"
+            write_text(verify_path, json.dumps({
+                "ts": utc_now_iso(), "expected_sha": sha,
+                "expected_branch": branch, "reason": reason,
+            }, ensure_ascii=False))
     except Exception:
         log.debug("Failed to read VERSION file or git ref for restart verification", exc_info=True)
         pass
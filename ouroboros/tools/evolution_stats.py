@@ -13,12 +13,15 @@ Collects metrics per sampled commit:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import re
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -26,16 +29,63 @@ log = logging.getLogger(__name__)
 
 _VERSION_RE = re.compile(r"v(\d+\.\d+\.\d+)")
 _REPO_DIR = Path(os.environ.get("OUROBOROS_REPO_DIR", str(Path.home() / "Ouroboros" / "repo")))
+_EVOLUTION_FILE = "docs/evolution.json"
 
 # How many data-points to generate (sampled across full history)
 MAX_POINTS = 100
+# Parallel commits scanned by _collect_data (each scan is git-subprocess bound)
+_COLLECT_WORKERS = 4
+
+# Shared keep-alive session for api.github.com (GET sha + PUT reuse one connection);
+# set by _reset_push_state below
+_GH_SESSION: Any = None
+_GH_SESSION_TOKEN = ""
+_GH_SESSION_LOCK: threading.Lock
+
+# Per-target push memo: "<url>@<branch>" -> {"sha": blob sha after our last PUT,
+# "content_hash": digest of that payload, "etag"/"etag_sha": validator + sha from the last GET}
+_PUSH_CACHE: dict[str, dict[str, Any]] = {}
+
+# Background push: one in flight at a time, newer data replaces a queued payload.
+# Set by _reset_push_state (at import and again in every forked child).
+_PUSH_EXECUTOR: ThreadPoolExecutor
+_PUSH_LOCK: threading.Lock
+_PUSH_INFLIGHT: threading.Event
+_PUSH_PENDING: dict[str, Any] | None = None
+# Outcome of the most recent background push, reported by the next tool call
+_PUSH_LAST = ""
+
+
+def _reset_push_state() -> None:
+    """Give this process its own push executor, lock, flag and GitHub session.
+
+    Workers are forked: the parent's executor thread doesn't exist in the
+    child, its in-flight flag and lock may be mid-update, and a pooled
+    keep-alive socket must not be shared between processes.
+    """
+    global _PUSH_EXECUTOR, _PUSH_LOCK, _PUSH_INFLIGHT, _PUSH_PENDING, _PUSH_LAST
+    global _GH_SESSION, _GH_SESSION_TOKEN, _GH_SESSION_LOCK
+    _PUSH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evolution_push")
+    _PUSH_LOCK = threading.Lock()
+    _PUSH_INFLIGHT = threading.Event()
+    _PUSH_PENDING = None
+    _PUSH_LAST = ""
+    _GH_SESSION = None
+    _GH_SESSION_TOKEN = ""
+    _GH_SESSION_LOCK = threading.Lock()
+
+
+_reset_push_state()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_push_state)
 
-def _git(args: list[str], timeout: int = 15) -> str:
-    """Run git command in repo dir, return stdout or empty string on error."""
+
+def _git(args: list[str], timeout: int = 15, repo_dir: Path | None = None) -> str:
+    """Run git command in repo_dir (default: _REPO_DIR), return stdout or empty string on error."""
     try:
         r = subprocess.run(
             ["git"] + args,
-            cwd=str(_REPO_DIR),
+            cwd=str(repo_dir or _REPO_DIR),
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -46,21 +96,21 @@ def _git(args: list[str], timeout: int = 15) -> str:
         return ""
 
 
-def _count_py_lines(commit_hash: str) -> tuple[int, int]:
+def _count_py_lines(commit_hash: str, repo_dir: Path | None = None) -> tuple[int, int]:
     """Return (total_py_lines, module_count) for a commit using git show."""
-    tree = _git(["ls-tree", "-r", "--name-only", commit_hash])
+    tree = _git(["ls-tree", "-r", "--name-only", commit_hash], repo_dir=repo_dir)
     py_files = [f for f in tree.splitlines() if f.endswith(".py")]
     total_lines = 0
     for f in py_files:
-        content = _git(["show", f"{commit_hash}:{f}"], timeout=10)
+        content = _git(["show", f"{commit_hash}:{f}"], timeout=10, repo_dir=repo_dir)
         total_lines += content.count("\n")
     return total_lines, len(py_files)
 
 
-def _get_file_bytes(commit_hash: str, *candidate_paths: str) -> int:
+def _get_file_bytes(commit_hash: str, *candidate_paths: str, repo_dir: Path | None = None) -> int:
     """Return byte size of first existing file path in the commit, or 0."""
     for path in candidate_paths:
-        content = _git(["show", f"{commit_hash}:{path}"], timeout=10)
+        content = _git(["show", f"{commit_hash}:{path}"], timeout=10, repo_dir=repo_dir)
         if content:
             return len(content.encode("utf-8"))
     return 0
@@ -71,10 +121,10 @@ def _extract_version(msg: str) -> str | None:
     return m.group(1) if m else None
 
 
-def _collect_data() -> list[dict[str, Any]]:
-    """Walk git history, sample commits, extract metrics."""
+def _collect_data(repo_dir: Path | None = None) -> list[dict[str, Any]]:
+    """Walk git history of repo_dir (default: _REPO_DIR), sample commits, extract metrics."""
     log.info("evolution_stats: reading git log...")
-    log_out = _git(["log", "--pretty=format:%H|%aI|%s", "--no-merges"])
+    log_out = _git(["log", "--pretty=format:%H|%aI|%s", "--no-merges"], repo_dir=repo_dir)
     all_commits = []
     for line in log_out.splitlines():
         parts = line.split("|", 2)
@@ -112,14 +162,13 @@ def _collect_data() -> list[dict[str, Any]]:
     log.info("evolution_stats: processing %d sampled commits...", len(selected))
     t0 = time.time()
 
-    points: list[dict[str, Any]] = []
-    for pos, idx in enumerate(selected):
+    def _point(idx: int) -> dict[str, Any]:
         c = all_commits[idx]
         h = c["hash"]
-        py_lines, module_count = _count_py_lines(h)
-        bible_bytes = _get_file_bytes(h, "BIBLE.md", "prompts/BIBLE.md")
-        system_bytes = _get_file_bytes(h, "prompts/SYSTEM.md", "SYSTEM.md")
-        points.append({
+        py_lines, module_count = _count_py_lines(h, repo_dir)
+        bible_bytes = _get_file_bytes(h, "BIBLE.md", "prompts/BIBLE.md", repo_dir=repo_dir)
+        system_bytes = _get_file_bytes(h, "prompts/SYSTEM.md", "SYSTEM.md", repo_dir=repo_dir)
+        return {
             "ts": c["ts"],
             "hash": h[:8],
             "msg": c["msg"][:80],
@@ -128,21 +177,50 @@ def _collect_data() -> list[dict[str, Any]]:
             "module_count": module_count,
             "bible_bytes": bible_bytes,
             "system_bytes": system_bytes,
-        })
-        if (pos + 1) % 10 == 0:
-            log.info(
-                "evolution_stats: %d/%d done (%.1fs)",
-                pos + 1, len(selected), time.time() - t0,
-            )
+        }
+
+    # Each point is a string of git subprocesses; overlap them (map keeps order)
+    points: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=_COLLECT_WORKERS, thread_name_prefix="evolution_stats") as pool:
+        for pos, point in enumerate(pool.map(_point, selected)):
+            points.append(point)
+            if (pos + 1) % 10 == 0:
+                log.info(
+                    "evolution_stats: %d/%d done (%.1fs)",
+                    pos + 1, len(selected), time.time() - t0,
+                )
 
     log.info("evolution_stats: collected %d points in %.1fs", len(points), time.time() - t0)
     return points
 
 
+def _github_session(token: str):
+    """Return the pooled GitHub API session, (re)creating it when the token changes."""
+    global _GH_SESSION, _GH_SESSION_TOKEN
+    with _GH_SESSION_LOCK:
+        if _GH_SESSION is None or _GH_SESSION_TOKEN != token:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                          allowed_methods=["GET", "PUT"])
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry))
+            session.headers.update({
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github.v3+json",
+            })
+            if _GH_SESSION is not None:
+                _GH_SESSION.close()
+            _GH_SESSION = session
+            _GH_SESSION_TOKEN = token
+        return _GH_SESSION
+
+
 def _push_to_github(data: dict[str, Any]) -> str:
     """Push evolution.json to the repo's docs/ folder via GitHub API."""
     import base64
-    import requests
 
     token = os.environ.get("GITHUB_TOKEN", "").strip()
     if not token:
@@ -151,43 +229,108 @@ def _push_to_github(data: dict[str, Any]) -> str:
     user = os.environ.get("GITHUB_USER", "")
     repo = os.environ.get("GITHUB_REPO", "")
     repo_slug = f"{user}/{repo}"
-    file_path = "docs/evolution.json"
+    file_path = _EVOLUTION_FILE
     branch = os.environ.get("GITHUB_BRANCH", "ouroboros")
 
     url = f"https://api.github.com/repos/{repo_slug}/contents/{file_path}"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-
-    sha = None
-    r = requests.get(url, headers=headers, timeout=15)
-    if r.status_code == 200:
-        sha = r.json().get("sha")
-
-    content_str = json.dumps(data, ensure_ascii=False, indent=2)
-    content_b64 = base64.b64encode(content_str.encode("utf-8")).decode("utf-8")
+    session = _github_session(token)
+    cache_key = f"{url}@{branch}"
+    cached = _PUSH_CACHE.setdefault(cache_key, {})
+    n_points = len(data.get("points", []))
+
+    # generated_at changes on every run, so it stays out of the dedupe hash
+    stable = {k: v for k, v in data.items() if k != "generated_at"}
+    content_hash = hashlib.blake2b(
+        json.dumps(stable, ensure_ascii=False, sort_keys=True).encode("utf-8"), digest_size=16,
+    ).digest()
+    if cached.get("content_hash") == content_hash:
+        return f"unchanged: {file_path} already has these {n_points} points"
+
+    # Encode straight to bytes; base64 output is pure ASCII
+    payload_bytes = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    content_b64 = base64.b64encode(payload_bytes).decode("ascii")
+    del payload_bytes
+
+    def _fetch_sha() -> str | None:
+        # Conditional GET: 304 (empty body) means the blob we last saw is still current
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") else {}
+        r = session.get(url, headers=headers, timeout=15)
+        if r.status_code == 304:
+            return cached.get("etag_sha")
+        if r.status_code != 200:
+            return None
+        remote_sha = r.json().get("sha")
+        cached.update(etag=r.headers.get("ETag"), etag_sha=remote_sha)
+        return remote_sha
+
+    sha = cached.get("sha") or _fetch_sha()
+    for attempt in range(2):
+        payload = {
+            "message": f"evolution: {n_points} data points",
+            "content": content_b64,
+            "branch": branch,
+        }
+        if sha:
+            payload["sha"] = sha
+
+        put_r = session.put(url, json=payload, timeout=15)
+        if put_r.status_code in [200, 201]:
+            new_sha = (put_r.json().get("content") or {}).get("sha")
+            cached.update(sha=new_sha, content_hash=content_hash)
+            return f"pushed {n_points} points to {file_path}"
+        # Stale cached sha (file changed remotely) — refetch once and retry
+        if attempt == 0 and put_r.status_code in (409, 422) and cached.pop("sha", None):
+            cached.pop("content_hash", None)
+            sha = _fetch_sha()
+            continue
+        break
+    return f"error: {put_r.status_code} — {put_r.text[:200]}"
 
-    payload = {
-        "message": f"evolution: {len(data.get('points', []))} data points",
-        "content": content_b64,
-        "branch": branch,
-    }
-    if sha:
-        payload["sha"] = sha
 
-    put_r = requests.put(url, headers=headers, json=payload, timeout=15)
-    if put_r.status_code in [200, 201]:
-        return f"pushed {len(data.get('points', []))} points to {file_path}"
-    return f"error: {put_r.status_code} — {put_r.text[:200]}"
+def _drain_pushes() -> None:
+    """Push the latest pending payload until none is left (runs on _PUSH_EXECUTOR)."""
+    global _PUSH_PENDING, _PUSH_LAST
+    while True:
+        with _PUSH_LOCK:
+            data, _PUSH_PENDING = _PUSH_PENDING, None
+            if data is None:
+                _PUSH_INFLIGHT.clear()
+                return
+        try:
+            result = _push_to_github(data)
+            log.info("evolution_stats: %s", result)
+        except Exception as e:
+            log.warning("evolution_stats: background push failed", exc_info=True)
+            result = f"error: {type(e).__name__}: {e}"
+        with _PUSH_LOCK:
+            _PUSH_LAST = result
+
+
+def _schedule_push(data: dict[str, Any]) -> str:
+    """Queue data for a background GitHub push, coalescing with any push in flight.
+
+    The returned status carries the outcome of the previous background push,
+    so a failure (bad token, 404, conflict) reaches the caller on its next call.
+    """
+    global _PUSH_PENDING
+    if not os.environ.get("GITHUB_TOKEN", "").strip():
+        return "error: GITHUB_TOKEN not found"
+    with _PUSH_LOCK:
+        _PUSH_PENDING = data
+        last = f" (last push: {_PUSH_LAST})" if _PUSH_LAST else ""
+        if _PUSH_INFLIGHT.is_set():
+            return f"push coalesced with in-flight update{last}"
+        _PUSH_INFLIGHT.set()
+    _PUSH_EXECUTOR.submit(_drain_pushes)
+    return f"push of {len(data.get('points', []))} points queued{last}"
 
 
-def generate_evolution_stats() -> str:
+def generate_evolution_stats(repo_dir: Path | None = None) -> str:
     """Collect git-based evolution metrics and push to docs/evolution.json.
 
     Returns a human-readable summary string.
     """
-    points = _collect_data()
+    points = _collect_data(repo_dir)
     if not points:
         return "No data collected (empty git history?)"
 
@@ -200,7 +343,7 @@ def generate_evolution_stats() -> str:
         "points": points,
     }
 
-    result = _push_to_github(data)
+    result = _schedule_push(data)
     last = points[-1]
     return (
         f"evolution_stats: {result} | "
@@ -223,7 +366,8 @@ def get_tools():
                     "Collects per-commit metrics across three axes: "
                     "Technical (Python lines of code), Philosophical (BIBLE.md size), "
                     "Self-Concept (SYSTEM.md size). "
-                    "Pushes docs/evolution.json via GitHub API. "
+                    "Pushes docs/evolution.json via GitHub API in the background; "
+                    "the outcome of the previous push is reported on the next call. "
                     "Safe to call anytime; takes 15-30s for full history scan."
                 ),
                 "parameters": {
@@ -232,6 +376,6 @@ def get_tools():
                     "required": [],
                 },
             },
-            lambda ctx, **_: generate_evolution_stats(),
+            lambda ctx, **_: generate_evolution_stats(ctx.repo_dir),
         )
     ]
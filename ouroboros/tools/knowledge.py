@@ -6,6 +6,7 @@ stored in memory/knowledge/ on the local data directory. Auto-maintains an index
 
 import json
 import logging
+import os
 import re
 from pathlib import Path
 from typing import List
@@ -105,23 +106,31 @@ def _extract_summary(text: str, max_chars: int = 150) -> str:
 def _rebuild_index(ctx: ToolContext):
     """Rebuild the knowledge index from all .md files (full scan)."""
     kdir = ctx.drive_path(KNOWLEDGE_DIR)
-    if not kdir.exists():
+
+    # scandir's cached d_type answers is_file() without a stat per entry
+    try:
+        with os.scandir(kdir) as it:
+            md_files = sorted(
+                (e for e in it
+                 if e.name.endswith(".md") and e.name != INDEX_FILE and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except FileNotFoundError:
         return
 
     entries = []
-    for f in sorted(kdir.glob("*.md")):
-        if f.name == INDEX_FILE:
-            continue
+    for f in md_files:
         # Sanitize topic from filename to protect against hand-crafted filenames
         try:
-            topic = _sanitize_topic(f.stem)
+            topic = _sanitize_topic(f.name[:-3])
         except ValueError:
             # Skip files with invalid names
             continue
 
         # Read first 3 non-heading lines as summary
         try:
-            text = f.read_text(encoding="utf-8").strip()
+            with open(f.path, "rb") as fh:
+                text = fh.read().decode("utf-8").strip()
             summary = _extract_summary(text)
             entries.append(f"- **{topic}**: {summary}")
         except Exception:
@@ -203,9 +212,10 @@ def _knowledge_read(ctx: ToolContext, topic: str) -> str:
     except ValueError as e:
         return f"⚠️ Invalid topic: {e}"
 
-    if not path.exists():
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return f"Topic '{sanitized_topic}' not found. Use knowledge_list to see available topics."
-    return path.read_text(encoding="utf-8")
 
 
 def _knowledge_write(ctx: ToolContext, topic: str, content: str, mode: str = "overwrite") -> str:
@@ -244,11 +254,12 @@ def _knowledge_write(ctx: ToolContext, topic: str, content: str, mode: str = "ov
     try:
         journal_path = ctx.drive_root / "memory" / "knowledge_journal.jsonl"
         total_kb = 0
-        knowledge_dir = ctx.drive_root / KNOWLEDGE_DIR
-        if knowledge_dir.exists():
-            for f in knowledge_dir.iterdir():
-                if f.is_file() and f.suffix == ".md":
-                    total_kb += f.stat().st_size / 1024
+        # One scandir pass: name and d_type come free with the listing; the size
+        # still costs one stat per .md file (DirEntry.stat() on POSIX)
+        with os.scandir(ctx.drive_root / KNOWLEDGE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".md") and entry.is_file():
+                    total_kb += entry.stat().st_size / 1024
         entry = {
             "ts": utc_now_iso(),
             "topic": sanitized_topic,
@@ -269,16 +280,17 @@ def _knowledge_list(ctx: ToolContext) -> str:
     kdir = ctx.drive_path(KNOWLEDGE_DIR)
     index_path = kdir / INDEX_FILE
 
-    if index_path.exists():
+    try:
         return index_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
 
-    # No index yet — build it
-    if kdir.exists():
-        _rebuild_index(ctx)
-        if index_path.exists():
-            return index_path.read_text(encoding="utf-8")
-
-    return "Knowledge base is empty. Use knowledge_write to add topics."
+    # No index yet — build it (no-op when the knowledge dir is missing)
+    _rebuild_index(ctx)
+    try:
+        return index_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return "Knowledge base is empty. Use knowledge_write to add topics."
 
 
 # --- Tool registration ---
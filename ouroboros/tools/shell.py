@@ -217,6 +217,16 @@ _NODE_DIR = pathlib.Path.home() / "Ouroboros" / "node"
 _NODE_BIN = _NODE_DIR if IS_WINDOWS else _NODE_DIR / "bin"
 _install_lock = threading.Lock()
 _path_initialized = False
+_claude_bin: Optional[str] = None
+
+
+def _find_claude() -> Optional[str]:
+    """Resolve the claude binary, re-scanning PATH only if the cached path disappeared."""
+    global _claude_bin
+    if _claude_bin and os.path.isfile(_claude_bin):
+        return _claude_bin
+    _claude_bin = shutil.which("claude")
+    return _claude_bin
 
 
 def _ensure_claude_cli(ctx: ToolContext) -> Tuple[Optional[str], bool]:
@@ -225,12 +235,12 @@ def _ensure_claude_cli(ctx: ToolContext) -> Tuple[Optional[str], bool]:
     Returns (error_string, freshly_installed).
     """
     _ensure_path()
-    if shutil.which("claude"):
+    if _find_claude():
         return None, False
 
     with _install_lock:
         _ensure_path()
-        if shutil.which("claude"):
+        if _find_claude():
             return None, False
 
         ctx.emit_progress_fn("Claude CLI not found. Installing Node.js + Claude Code...")
@@ -258,7 +268,7 @@ def _ensure_claude_cli(ctx: ToolContext) -> Tuple[Optional[str], bool]:
             return f"⚠️ npm install failed: {e}", False
 
         _ensure_path()
-        if shutil.which("claude"):
+        if _find_claude():
             ctx.emit_progress_fn("Claude Code CLI installed successfully.")
             return None, True
         return "⚠️ Claude Code CLI binary not found in PATH after auto-install.", False
@@ -334,7 +344,7 @@ def _ensure_path():
 def _run_claude_cli(work_dir: str, prompt: str, env: dict,
                     model: str = "", budget: Optional[float] = None) -> CompletedProcess:
     """Run Claude CLI with permission-mode fallback."""
-    claude_bin = shutil.which("claude")
+    claude_bin = _find_claude()
     cmd = [
         claude_bin, "-p", prompt,
         "--output-format", "json",
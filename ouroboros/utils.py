@@ -59,6 +59,39 @@ def write_text(path: pathlib.Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def tail_lines(path: pathlib.Path, n: int, chunk_size: int = 65536) -> List[str]:
+    """Return the last n non-empty lines of a file, reading backwards from EOF.
+
+    Only the trailing chunks needed to cover n lines are read, so cost does not
+    grow with the size of an append-only log. Raises FileNotFoundError.
+    """
+    if n <= 0:
+        return []
+    chunks: List[bytes] = []
+    newlines = 0
+    need = n + 1  # n lines end within the last n+1 newlines
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while True:
+            # Seek back counting newlines only; chunks are joined once per pass
+            while pos > 0 and newlines < need:
+                step = min(chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+            lines = b"".join(reversed(chunks)).split(b"\n")
+            if pos > 0:
+                lines = lines[1:]  # first piece may be a partial line
+            lines = [ln for ln in lines if ln.strip()]
+            if len(lines) >= n or pos == 0:
+                break
+            # Blank lines used up the budget; doubling keeps the re-joins linear
+            need *= 2
+    return [ln.decode("utf-8", errors="replace").strip() for ln in lines[-n:]]
+
+
 def append_jsonl(path: pathlib.Path, obj: Dict[str, Any]) -> None:
     """Append a JSON object as a line to a JSONL file (concurrent-safe)."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -216,8 +249,45 @@ def run_cmd(cmd: List[str], cwd: Optional[pathlib.Path] = None) -> str:
 # Git helpers
 # ---------------------------------------------------------------------------
 
+# repo_dir -> (head key, (branch, sha)); see _git_head_key
+_GIT_INFO_CACHE: Dict[str, tuple] = {}
+
+
+def _git_head_key(repo_dir: pathlib.Path) -> Optional[tuple]:
+    """Cheap fingerprint of what HEAD points at: HEAD contents + stat of its ref.
+
+    Any commit, checkout or reset rewrites one of these. Loose refs are always
+    41 bytes and mtime can be coarse (1s on HFS+), so the inode is part of the
+    key: git rewrites refs via lockfile + rename, which yields a new inode.
+    Returns None when the layout is unusual (e.g. .git is a worktree file),
+    which disables caching.
+    """
+    git_dir = repo_dir / ".git"
+    try:
+        head = (git_dir / "HEAD").read_bytes().strip()
+    except OSError:
+        return None
+    if not head.startswith(b"ref: "):
+        return (head, None)
+    ref = head[5:].decode("utf-8", errors="replace")
+    for candidate in (git_dir / ref, git_dir / "packed-refs"):
+        try:
+            st = os.stat(candidate)
+        except OSError:
+            continue
+        return (head, str(candidate), st.st_ino, st.st_mtime_ns, st.st_size)
+    return None
+
+
 def get_git_info(repo_dir: pathlib.Path) -> tuple[str, str]:
-    """Best-effort retrieval of (git_branch, git_sha)."""
+    """Best-effort retrieval of (git_branch, git_sha).
+
+    Memoised per repo until HEAD or the ref it points to changes on disk.
+    """
+    key = _git_head_key(pathlib.Path(repo_dir))
+    cached = _GIT_INFO_CACHE.get(str(repo_dir))
+    if key is not None and cached is not None and cached[0] == key:
+        return cached[1]
     branch = ""
     sha = ""
     try:
@@ -240,6 +310,8 @@ def get_git_info(repo_dir: pathlib.Path) -> tuple[str, str]:
     except Exception:
         log.debug("Failed to get git SHA", exc_info=True)
         pass
+    if key is not None and branch and sha:
+        _GIT_INFO_CACHE[str(repo_dir)] = (key, (branch, sha))
     return branch, sha
 
 
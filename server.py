@@ -115,6 +115,7 @@ def broadcast_ws_sync(msg: dict) -> None:
 from ouroboros.config import (
     SETTINGS_DEFAULTS as _SETTINGS_DEFAULTS,
     load_settings, save_settings, apply_settings_to_env as _apply_settings_to_env,
+    parse_budget as _parse_budget,
 )
 from ouroboros.server_runtime import has_local_routing, setup_remote_if_configured, ws_heartbeat_loop
 
@@ -127,11 +128,20 @@ _supervisor_error: Optional[str] = None
 _event_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
+def _start_import_warmup(module_name: str) -> threading.Thread:
+    """Import module_name on a daemon thread; start only after workers fork (never fork mid-import)."""
+    import importlib
+    t = threading.Thread(target=importlib.import_module, args=(module_name,), daemon=True)
+    t.start()
+    return t
+
+
 def _run_supervisor(settings: dict) -> None:
     """Initialize and run the supervisor loop. Called in a background thread."""
     global _supervisor_error
 
     _apply_settings_to_env(settings)
+    total_budget = _parse_budget(settings.get("TOTAL_BUDGET"))
 
     try:
         from supervisor.message_bus import init as bus_init
@@ -145,14 +155,14 @@ def _run_supervisor(settings: dict) -> None:
 
         bus_init(
             drive_root=DATA_DIR,
-            total_budget_limit=float(settings.get("TOTAL_BUDGET", 10.0)),
+            total_budget_limit=total_budget,
             budget_report_every=10,
             chat_bridge=bridge,
         )
 
         from supervisor.state import init as state_init, init_state, load_state, save_state
         from supervisor.state import append_jsonl, update_budget_from_usage, rotate_chat_log_if_needed
-        state_init(DATA_DIR, float(settings.get("TOTAL_BUDGET", 10.0)))
+        state_init(DATA_DIR, total_budget)
         init_state()
 
         from supervisor.git_ops import init as git_ops_init, ensure_repo_present, safe_restart
@@ -184,20 +194,22 @@ def _run_supervisor(settings: dict) -> None:
         workers_init(
             repo_dir=REPO_DIR, drive_root=DATA_DIR, max_workers=max_workers,
             soft_timeout=soft_timeout, hard_timeout=hard_timeout,
-            total_budget_limit=float(settings.get("TOTAL_BUDGET", 10.0)),
+            total_budget_limit=total_budget,
             branch_dev="ouroboros", branch_stable="ouroboros-stable",
         )
 
         from supervisor.events import dispatch_event
         from supervisor.message_bus import send_with_budget
-        from ouroboros.consciousness import BackgroundConsciousness
         import types
         import queue as _queue_mod
 
         kill_workers()
         spawn_workers(max_workers)
+        _bgc_warmup = _start_import_warmup("ouroboros.consciousness")
         restored_pending = restore_pending_from_snapshot()
         persist_queue_snapshot(reason="startup")
+        from ouroboros.owner_inject import clear_stale_mailboxes
+        clear_stale_mailboxes(DATA_DIR, keep_task_ids=[t.get("id") for t in PENDING])
 
         if restored_pending > 0:
             st_boot = load_state()
@@ -215,6 +227,8 @@ def _run_supervisor(settings: dict) -> None:
             except Exception:
                 return None
 
+        _bgc_warmup.join()
+        from ouroboros.consciousness import BackgroundConsciousness
         _consciousness = BackgroundConsciousness(
             drive_root=DATA_DIR, repo_dir=REPO_DIR,
             event_queue=get_event_q(), owner_chat_id_fn=_get_owner_chat_id,
@@ -361,7 +375,7 @@ def _run_supervisor(settings: dict) -> None:
                         ).start()
 
             crash_count = 0
-            time.sleep(0.5)
+            _restart_requested.wait(0.5)
 
         except Exception as exc:
             crash_count += 1
@@ -369,7 +383,7 @@ def _run_supervisor(settings: dict) -> None:
             if crash_count >= 3:
                 log.critical("Supervisor exceeded max retries.")
                 return
-            time.sleep(min(30, 2 ** crash_count))
+            _restart_requested.wait(min(30, 2 ** crash_count))
 
 
 def _handle_restart_in_supervisor(evt: Dict[str, Any], ctx: Any) -> None:
@@ -714,39 +728,27 @@ async def api_cost_breakdown(request: Request) -> JSONResponse:
         if events_path.exists():
             with events_path.open("r", encoding="utf-8") as f:
                 for line in f:
-                    line = line.strip()
-                    if not line:
+                    # Most events are not llm_usage — skip them before paying for a parse
+                    if "llm_usage" not in line:
                         continue
                     try:
                         evt = json.loads(line)
-                    except Exception:
+                    except json.JSONDecodeError:
                         continue
                     if evt.get("type") != "llm_usage":
                         continue
                     cost = float(evt.get("cost") or 0)
-                    model = str(evt.get("model") or "unknown")
-                    api_key_type = str(evt.get("api_key_type") or evt.get("provider") or "openrouter")
-                    model_cat = str(evt.get("model_category") or "other")
-                    task_cat = str(evt.get("category") or "task")
-
                     total_cost += cost
                     total_calls += 1
-
-                    e = _acc(by_model, model)
-                    e["cost"] += cost
-                    e["calls"] += 1
-
-                    e = _acc(by_api_key, api_key_type)
-                    e["cost"] += cost
-                    e["calls"] += 1
-
-                    e = _acc(by_model_category, model_cat)
-                    e["cost"] += cost
-                    e["calls"] += 1
-
-                    e = _acc(by_task_category, task_cat)
-                    e["cost"] += cost
-                    e["calls"] += 1
+                    for bucket, key in (
+                        (by_model, evt.get("model") or "unknown"),
+                        (by_api_key, evt.get("api_key_type") or evt.get("provider") or "openrouter"),
+                        (by_model_category, evt.get("model_category") or "other"),
+                        (by_task_category, evt.get("category") or "task"),
+                    ):
+                        e = _acc(bucket, str(key))
+                        e["cost"] += cost
+                        e["calls"] += 1
     except Exception:
         pass
 
@@ -993,8 +995,7 @@ if __name__ == "__main__":
 
     def _check_restart():
         """Monitor for restart signal, then shut down uvicorn."""
-        while not _restart_requested.is_set():
-            time.sleep(0.5)
+        _restart_requested.wait()
         log.info("Restart requested — closing WebSocket clients and shutting down server.")
 
         # Close all WebSocket connections so uvicorn can shut down cleanly
@@ -314,11 +314,20 @@ def _handle_promote_to_stable(evt: Dict[str, Any], ctx: Any) -> None:
     try:
         sp.run(["git", "remote", "get-url", "origin"], cwd=str(ctx.REPO_DIR),
                capture_output=True, check=True)
-        sp.run(
-            ["git", "push", "origin", f"{ctx.BRANCH_DEV}:{ctx.BRANCH_STABLE}"],
-            cwd=str(ctx.REPO_DIR), check=True,
-        )
-        remote_status = " (pushed to origin)"
+        # Tip-SHA compare against the remote-tracking ref (a ref-file read)
+        # instead of a network push when origin already has this commit.
+        remote_sha = sp.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"refs/remotes/origin/{ctx.BRANCH_STABLE}"],
+            cwd=str(ctx.REPO_DIR), capture_output=True, text=True,
+        ).stdout.strip()
+        if remote_sha == new_sha:
+            remote_status = " (origin already up to date)"
+        else:
+            sp.run(
+                ["git", "push", "origin", f"{ctx.BRANCH_DEV}:{ctx.BRANCH_STABLE}"],
+                cwd=str(ctx.REPO_DIR), check=True,
+            )
+            remote_status = " (pushed to origin)"
     except Exception:
         log.debug("No remote or push failed — local-only promote")
 
@@ -6,20 +6,27 @@ Clone, checkout, reset, rescue snapshots, dependency sync, import test.
 
 from __future__ import annotations
 
+import atexit
 import datetime
+import hashlib
 import json
 import logging
 import os
 import pathlib
+import queue
 import re
+import shlex
 import shutil
+import stat
 import subprocess
 import sys
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 from supervisor.state import (
-    load_state, save_state, append_jsonl, atomic_write_text,
+    load_state, save_state, state_session, append_jsonl, write_synced, fsync_dir,
 )
 
 log = logging.getLogger(__name__)
@@ -45,15 +52,107 @@ def init(repo_dir: pathlib.Path, drive_root: pathlib.Path, remote_url: str,
     BRANCH_STABLE = branch_stable
 
 
+# ---------------------------------------------------------------------------
+# Supervisor event log (written off the decision path)
+# ---------------------------------------------------------------------------
+_LOG_QUEUE: "queue.Queue[Tuple[pathlib.Path, Dict[str, Any]]]" = queue.Queue()
+_LOG_WRITER: Optional[threading.Thread] = None
+_LOG_WRITER_LOCK = threading.Lock()
+
+
+def _log_writer_loop() -> None:
+    while True:
+        path, event = _LOG_QUEUE.get()
+        try:
+            append_jsonl(path, event)
+        except Exception:
+            log.debug("Failed to append supervisor event", exc_info=True)
+        finally:
+            _LOG_QUEUE.task_done()
+
+
+def _log_event(event: Dict[str, Any]) -> None:
+    """Queue an event for supervisor.jsonl; a daemon thread does the append."""
+    global _LOG_WRITER
+    with _LOG_WRITER_LOCK:
+        if _LOG_WRITER is None or not _LOG_WRITER.is_alive():
+            _LOG_WRITER = threading.Thread(
+                target=_log_writer_loop, name="git_ops_log", daemon=True)
+            _LOG_WRITER.start()
+    _LOG_QUEUE.put((DRIVE_ROOT / "logs" / "supervisor.jsonl", event))
+
+
+def flush_event_log() -> None:
+    """Block until every queued supervisor event has been written."""
+    _LOG_QUEUE.join()
+
+
+atexit.register(flush_event_log)
+
+
 # ---------------------------------------------------------------------------
 # Git helpers
 # ---------------------------------------------------------------------------
 
+# Prefix for read-only queries: status/diff otherwise opportunistically refresh
+# and rewrite the index (taking index.lock), racing a concurrent checkout/reset.
+_GIT_RO: List[str] = ["git", "--no-optional-locks"]
+
+
+_GIT_EXE: Optional[str] = None
+
+
+def _spawn_args(cmd: List[str]) -> Tuple[List[str], Dict[str, Any]]:
+    """Shape a git command so subprocess can launch it via posix_spawn.
+
+    CPython only takes its posix_spawn (vfork+exec) path for an absolute
+    executable, no cwd and close_fds=False; otherwise it falls back to
+    fork_exec. So resolve git once and use ``git -C REPO_DIR`` instead of cwd.
+
+    Only local read-only queries (the _GIT_RO prefix) take this path: with
+    close_fds=False any inheritable fd (from the launcher or a C extension)
+    reaches the child, so fetch/push and anything else that may run ssh or
+    credential helpers keep the default close_fds=True.
+    """
+    global _GIT_EXE
+    if os.name == "posix" and cmd[:len(_GIT_RO)] == _GIT_RO:
+        if _GIT_EXE is None:
+            _GIT_EXE = shutil.which("git") or ""
+        if _GIT_EXE:
+            return [_GIT_EXE, "-C", str(REPO_DIR), *cmd[1:]], {"close_fds": False}
+    return cmd, {"cwd": str(REPO_DIR)}
+
+
 def git_capture(cmd: List[str]) -> Tuple[int, str, str]:
-    r = subprocess.run(cmd, cwd=str(REPO_DIR), capture_output=True, text=True)
+    argv, kwargs = _spawn_args(cmd)
+    r = subprocess.run(argv, capture_output=True, text=True, **kwargs)
     return r.returncode, (r.stdout or "").strip(), (r.stderr or "").strip()
 
 
+def _git_capture_bytes(cmd: List[str]) -> Tuple[int, bytes, str]:
+    """Like git_capture, but stdout is returned raw (for large/binary output)."""
+    argv, kwargs = _spawn_args(cmd)
+    r = subprocess.run(argv, capture_output=True, **kwargs)
+    return r.returncode, r.stdout or b"", (r.stderr or b"").decode("utf-8", errors="replace").strip()
+
+
+def _git_script(steps: List[List[str]]) -> Tuple[int, str, str]:
+    """Run several commands as one ``sh -c 'A && B && C'`` process.
+
+    Stops at the first failing step. stdout/stderr are those of the whole
+    script, so only the last step should print anything the caller needs.
+    On Windows (no POSIX sh) the steps run one by one with the same semantics.
+    """
+    if sys.platform == "win32":
+        rc, out, err = 0, "", ""
+        for step in steps:
+            rc, out, err = git_capture(step)
+            if rc != 0:
+                break
+        return rc, out, err
+    return git_capture(["sh", "-c", " && ".join(shlex.join(s) for s in steps)])
+
+
 _REPO_GITIGNORE = """\
 # Secrets
 .env
@@ -99,24 +198,28 @@ python-standalone/
 def _ensure_repo_gitignore(repo_dir: pathlib.Path = None) -> None:
     """Write .gitignore if missing — MUST run before any git add -A."""
     target = repo_dir or REPO_DIR
-    gi = target / ".gitignore"
-    if not gi.exists():
-        gi.write_text(_REPO_GITIGNORE, encoding="utf-8")
+    # O_EXCL create: one open() both checks for and writes the file
+    try:
+        with open(target / ".gitignore", "x", encoding="utf-8") as f:
+            f.write(_REPO_GITIGNORE)
+    except FileExistsError:
+        pass
 
 
 def _ensure_git_identity() -> None:
     """Ensure repo-local git identity exists for local commits/tags."""
-    git_capture(["git", "config", "user.name", "Ouroboros"])
-    git_capture(["git", "config", "user.email", "ouroboros@local.mac"])
+    _git_script([
+        ["git", "config", "user.name", "Ouroboros"],
+        ["git", "config", "user.email", "ouroboros@local.mac"],
+    ])
 
 
 def _ensure_local_version_tag() -> None:
     """Create the current VERSION tag locally when a local-only repo has none."""
-    version_path = REPO_DIR / "VERSION"
-    if not version_path.exists():
+    try:
+        version = (REPO_DIR / "VERSION").read_text(encoding="utf-8").strip().lstrip("v")
+    except FileNotFoundError:
         return
-
-    version = version_path.read_text(encoding="utf-8").strip().lstrip("v")
     if not re.match(r"^\d+\.\d+\.\d+$", version):
         return
 
@@ -169,6 +272,10 @@ def ensure_repo_present() -> None:
         subprocess.run(["git", "branch", "-M", BRANCH_DEV], cwd=str(REPO_DIR), check=False)
         subprocess.run(["git", "branch", BRANCH_STABLE], cwd=str(REPO_DIR), check=False)
 
+    # Let status/ls-files skip unchanged directories when looking for untracked
+    # files (fsmonitor stays off: no builtin daemon on Linux). Write only if unset.
+    if git_capture([*_GIT_RO, "config", "--type=bool", "--get", "core.untrackedCache"])[1] != "true":
+        git_capture(["git", "config", "core.untrackedCache", "true"])
     _ensure_local_version_tag()
 
 
@@ -176,7 +283,18 @@ def ensure_repo_present() -> None:
 # Repo sync state collection
 # ---------------------------------------------------------------------------
 
-def _collect_repo_sync_state() -> Dict[str, Any]:
+def _porcelain_v2_entry(line: str) -> str:
+    """Render a porcelain=v2 entry line in the short v1 ``XY path`` form."""
+    kind = line[:1]
+    if kind in ("?", "!"):
+        return f"{kind}{kind} {line[2:]}"
+    fields = line.split(" ", 10 if kind == "u" else 9 if kind == "2" else 8)
+    xy = fields[1].replace(".", " ") if len(fields) > 1 else "  "
+    path, _, orig = fields[-1].partition("\t")
+    return f"{xy} {orig} -> {path}" if orig else f"{xy} {path}"
+
+
+def _collect_repo_sync_state(has_remote: Optional[bool] = None) -> Dict[str, Any]:
     state: Dict[str, Any] = {
         "current_branch": "unknown",
         "dirty_lines": [],
@@ -184,93 +302,222 @@ def _collect_repo_sync_state() -> Dict[str, Any]:
         "warnings": [],
     }
 
-    rc, branch, err = git_capture(["git", "rev-parse", "--abbrev-ref", "HEAD"])
-    if rc == 0 and branch:
-        state["current_branch"] = branch
-    elif err:
-        state["warnings"].append(f"branch_error:{err}")
-
-    rc, dirty, err = git_capture(["git", "status", "--porcelain"])
-    if rc == 0 and dirty:
-        state["dirty_lines"] = [ln for ln in dirty.splitlines() if ln.strip()]
-    elif rc != 0 and err:
-        state["warnings"].append(f"status_error:{err}")
+    # One porcelain=v2 call reports branch, upstream, ahead/behind and dirty entries.
+    rc, out, err = git_capture([*_GIT_RO, "status", "--porcelain=v2", "--branch"])
+    if rc != 0:
+        if err:
+            state["warnings"].append(f"status_error:{err}")
+        return state
 
     upstream = ""
-    if _has_remote():
-        rc, up, err = git_capture(["git", "rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"])
-        if rc == 0 and up:
-            upstream = up
-        else:
-            current_branch = str(state.get("current_branch") or "")
-            if current_branch not in ("", "HEAD", "unknown"):
-                upstream = f"origin/{current_branch}"
-            elif err:
-                state["warnings"].append(f"upstream_error:{err}")
-
-        if upstream:
-            rc, unpushed, err = git_capture(["git", "log", "--oneline", f"{upstream}..HEAD"])
-            if rc == 0 and unpushed:
-                state["unpushed_lines"] = [ln for ln in unpushed.splitlines() if ln.strip()]
-            elif rc != 0 and err:
-                state["warnings"].append(f"unpushed_error:{err}")
+    ahead: Optional[int] = None
+    for ln in out.splitlines():
+        if ln.startswith("# branch.head "):
+            head = ln[len("# branch.head "):].strip()
+            state["current_branch"] = "HEAD" if head == "(detached)" else head
+        elif ln.startswith("# branch.upstream "):
+            upstream = ln[len("# branch.upstream "):].strip()
+        elif ln.startswith("# branch.ab "):
+            try:
+                ahead = int(ln.split()[2].lstrip("+"))
+            except (IndexError, ValueError):
+                ahead = None
+        elif ln.strip() and not ln.startswith("#"):
+            state["dirty_lines"].append(_porcelain_v2_entry(ln))
+
+    if not upstream:
+        if not (_has_remote() if has_remote is None else has_remote):
+            return state
+        current_branch = str(state.get("current_branch") or "")
+        if current_branch in ("", "HEAD", "unknown"):
+            return state
+        upstream = f"origin/{current_branch}"
+
+    # Only list commit subjects when there is something (possibly) unpushed.
+    if ahead == 0:
+        return state
+    rc, unpushed, err = git_capture([*_GIT_RO, "log", "--oneline", f"{upstream}..HEAD"])
+    if rc == 0 and unpushed:
+        state["unpushed_lines"] = [ln for ln in unpushed.splitlines() if ln.strip()]
+    elif rc != 0 and err:
+        state["warnings"].append(f"unpushed_error:{err}")
 
     return state
 
 
+def _iter_untracked_paths(proc: subprocess.Popen, chunk_size: int = 65536):
+    """Yield NUL-delimited paths from a running ``git ls-files -z`` as they arrive."""
+    buf = b""
+    while True:
+        chunk = proc.stdout.read(chunk_size)
+        if not chunk:
+            break
+        buf += chunk
+        *paths, buf = buf.split(b"\x00")
+        for raw in paths:
+            if raw:
+                yield os.fsdecode(raw)
+    if buf:
+        yield os.fsdecode(buf)
+
+
+def _copy_file_data(src: str, dst: str, size: int, src_dir_fd: Optional[int] = None) -> None:
+    """Copy file bytes only (no copystat); kernel-side via sendfile when available.
+
+    With src_dir_fd, src is relative to that directory (openat).
+    """
+    src_fd = os.open(src, os.O_RDONLY | getattr(os, "O_BINARY", 0), dir_fd=src_dir_fd)
+    with open(src_fd, "rb") as fsrc, open(dst, "wb") as fdst:
+        if hasattr(os, "sendfile"):
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+
+
 def _copy_untracked_for_rescue(dst_root: pathlib.Path, max_files: int = 200,
                                 max_total_bytes: int = 12_000_000) -> Dict[str, Any]:
     out: Dict[str, Any] = {
         "copied_files": 0, "skipped_files": 0, "copied_bytes": 0, "truncated": False,
     }
-    rc, txt, err = git_capture(["git", "ls-files", "--others", "--exclude-standard"])
-    if rc != 0:
-        out["error"] = err or "git ls-files failed"
-        return out
-
-    lines = [ln.strip() for ln in txt.splitlines() if ln.strip()]
-    if not lines:
+    # Stream the listing so a huge untracked set stops being read once the budget is spent.
+    try:
+        argv, kwargs = _spawn_args([*_GIT_RO, "ls-files", "--others", "--exclude-standard", "-z"])
+        proc = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
+    except OSError as e:
+        out["error"] = repr(e)
         return out
-
-    dst_root.mkdir(parents=True, exist_ok=True)
-    for rel in lines:
-        if out["copied_files"] >= max_files:
-            out["truncated"] = True
-            break
-        src = (REPO_DIR / rel).resolve()
+    # Drain stderr concurrently: git blocks if it fills the pipe while we read stdout.
+    err_chunks: List[bytes] = []
+    err_reader = threading.Thread(target=lambda: err_chunks.append(proc.stderr.read()), daemon=True)
+    err_reader.start()
+
+    repo_root = str(REPO_DIR.resolve())
+    repo_prefix = repo_root.rstrip(os.sep) + os.sep
+    # Plain strings in the loop; untracked files cluster by directory, so most
+    # parents are already known to exist.
+    dst_str = str(dst_root)
+    made_dirs: set = set()
+    # Resolve the repo root once into a directory fd; per-file stat/open are
+    # then relative lookups (fstatat/openat) instead of full path walks.
+    repo_fd: Optional[int] = None
+    if os.stat in os.supports_dir_fd and os.open in os.supports_dir_fd:
         try:
-            src.relative_to(REPO_DIR.resolve())
-        except Exception:
-            out["skipped_files"] += 1
-            continue
-        if not src.exists() or not src.is_file():
-            out["skipped_files"] += 1
-            continue
-        try:
-            size = int(src.stat().st_size)
-        except Exception:
-            out["skipped_files"] += 1
-            continue
-        if (out["copied_bytes"] + size) > max_total_bytes:
-            out["truncated"] = True
-            break
-        dst = dst_root / rel
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            shutil.copy2(src, dst)
-            out["copied_files"] += 1
-            out["copied_bytes"] += size
-        except Exception:
-            out["skipped_files"] += 1
+            repo_fd = os.open(repo_root, getattr(os, "O_PATH", os.O_RDONLY) | os.O_DIRECTORY)
+        except OSError:
+            repo_fd = None
+    drained = False
+    try:
+        for rel in _iter_untracked_paths(proc):
+            if out["copied_files"] >= max_files:
+                out["truncated"] = True
+                break
+            src = os.path.normpath(os.path.join(repo_root, rel))
+            if not src.startswith(repo_prefix):
+                out["skipped_files"] += 1
+                continue
+            # One lstat answers exists/is-file/size; symlinks are skipped so
+            # nothing outside the repo can be pulled in through them.
+            try:
+                if repo_fd is not None:
+                    st = os.stat(rel, dir_fd=repo_fd, follow_symlinks=False)
+                else:
+                    st = os.stat(src, follow_symlinks=False)
+            except OSError:
+                out["skipped_files"] += 1
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                out["skipped_files"] += 1
+                continue
+            size = st.st_size
+            if (out["copied_bytes"] + size) > max_total_bytes:
+                out["truncated"] = True
+                break
+            dst = os.path.join(dst_str, rel)
+            parent = os.path.dirname(dst)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
+            try:
+                if repo_fd is not None:
+                    _copy_file_data(rel, dst, size, src_dir_fd=repo_fd)
+                else:
+                    _copy_file_data(src, dst, size)
+                out["copied_files"] += 1
+                out["copied_bytes"] += size
+            except Exception:
+                out["skipped_files"] += 1
+        else:
+            drained = True
+    finally:
+        if repo_fd is not None:
+            os.close(repo_fd)
+        if not drained:
+            proc.kill()
+        err_reader.join()
+        err = b"".join(err_chunks).decode("utf-8", errors="replace").strip()
+        proc.stdout.close()
+        proc.stderr.close()
+        rc = proc.wait()
+    if rc != 0 and drained:
+        out["error"] = err or "git ls-files failed"
     return out
 
 
+def _capture_rescue_files(staging_dir: pathlib.Path, info: Dict[str, Any],
+                          repo_state: Dict[str, Any]) -> None:
+    """Write status, patch, untracked copies and unpushed log into staging_dir."""
+    rc_status, status_txt, _ = git_capture([*_GIT_RO, "status", "--porcelain"])
+    if rc_status == 0:
+        write_synced(staging_dir / "status.porcelain.txt",
+                      (status_txt + ("\n" if status_txt else "")).encode("utf-8"))
+
+    # stash create snapshots tracked changes as a dangling commit without
+    # touching refs or the worktree; the patch is then a tree-to-tree diff.
+    rc_stash, stash_sha, _ = git_capture(["git", "stash", "create", f"rescue: {info['reason']}"])
+    if rc_stash == 0 and not stash_sha:
+        rc_diff, diff_bytes, diff_err = 0, b"", ""
+    elif rc_stash == 0:
+        info["rescue_commit"] = stash_sha
+        rc_diff, diff_bytes, diff_err = _git_capture_bytes([*_GIT_RO, "diff", "--binary", "HEAD", stash_sha])
+    else:
+        rc_diff, diff_bytes, diff_err = _git_capture_bytes([*_GIT_RO, "diff", "--binary", "HEAD"])
+    if rc_diff == 0:
+        # Patches can be megabytes: write git's bytes as-is, no decode/re-encode.
+        write_synced(staging_dir / "changes.diff", diff_bytes)
+    else:
+        info["diff_error"] = diff_err or "git diff failed"
+
+    info["untracked"] = _copy_untracked_for_rescue(staging_dir / "untracked")
+
+    unpushed_lines = [ln for ln in (repo_state.get("unpushed_lines") or []) if str(ln).strip()]
+    if unpushed_lines:
+        write_synced(staging_dir / "unpushed_commits.txt",
+                      ("\n".join(unpushed_lines) + "\n").encode("utf-8"))
+
+
 def _create_rescue_snapshot(branch: str, reason: str,
                              repo_state: Dict[str, Any]) -> Dict[str, Any]:
     now = datetime.datetime.now(datetime.timezone.utc)
     ts = now.strftime("%Y%m%d_%H%M%S")
-    rescue_dir = DRIVE_ROOT / "archive" / "rescue" / f"{ts}_{uuid.uuid4().hex[:8]}"
-    rescue_dir.mkdir(parents=True, exist_ok=True)
+    name = f"{ts}_{uuid.uuid4().hex[:8]}"
+    rescue_dir = DRIVE_ROOT / "archive" / "rescue" / name
+    # Build the snapshot in a sibling staging dir on the same filesystem and
+    # publish it with one rename: each file is fsynced in place (no per-file
+    # tmp+rename), and readers of archive/rescue never see a half-written
+    # snapshot. A capture that fails partway is still published, marked
+    # partial: a reset may follow and this is the only copy of the work.
+    staging_dir = DRIVE_ROOT / "archive" / "rescue_staging" / name
+    staging_dir.mkdir(parents=True, exist_ok=True)
 
     info: Dict[str, Any] = {
         "ts": now.isoformat(),
@@ -282,29 +529,25 @@ def _create_rescue_snapshot(branch: str, reason: str,
         "warnings": list(repo_state.get("warnings") or []),
         "path": str(rescue_dir),
     }
+    try:
+        _capture_rescue_files(staging_dir, info, repo_state)
+    except Exception as e:
+        info["partial"] = True
+        info["capture_error"] = repr(e)
 
-    rc_status, status_txt, _ = git_capture(["git", "status", "--porcelain"])
-    if rc_status == 0:
-        atomic_write_text(rescue_dir / "status.porcelain.txt",
-                          status_txt + ("\n" if status_txt else ""))
-
-    rc_diff, diff_txt, diff_err = git_capture(["git", "diff", "--binary", "HEAD"])
-    if rc_diff == 0:
-        atomic_write_text(rescue_dir / "changes.diff",
-                          diff_txt + ("\n" if diff_txt else ""))
-    else:
-        info["diff_error"] = diff_err or "git diff failed"
-
-    untracked_meta = _copy_untracked_for_rescue(rescue_dir / "untracked")
-    info["untracked"] = untracked_meta
-
-    unpushed_lines = [ln for ln in (repo_state.get("unpushed_lines") or []) if str(ln).strip()]
-    if unpushed_lines:
-        atomic_write_text(rescue_dir / "unpushed_commits.txt",
-                          "\n".join(unpushed_lines) + "\n")
-
-    atomic_write_text(rescue_dir / "rescue_meta.json",
-                      json.dumps(info, ensure_ascii=False, indent=2))
+    try:
+        write_synced(staging_dir / "rescue_meta.json",
+                      json.dumps(info, ensure_ascii=False, indent=2).encode("utf-8"))
+        fsync_dir(staging_dir)
+        rescue_dir.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staging_dir, rescue_dir)
+    except OSError as e:
+        raise RuntimeError(f"rescue snapshot captured in {staging_dir} but not published: {e}") from e
+    fsync_dir(rescue_dir.parent)
+    try:
+        staging_dir.parent.rmdir()  # only succeeds once no other snapshot is staging
+    except OSError:
+        pass
     return info
 
 
@@ -318,14 +561,40 @@ def _has_remote() -> bool:
     return rc == 0 and bool(remotes.strip())
 
 
+# Small pool for git_ops work that can overlap other steps of a reset.
+_PROBE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="git_ops_probe")
+
+
+def _remove_pycache_dirs(root: pathlib.Path) -> None:
+    """Delete every __pycache__ under root in one pruned top-down walk.
+
+    Matched dirs (and .git) are pruned from the walk, so nothing inside them
+    is listed before rmtree removes them.
+    """
+    for dirpath, dirnames, _ in os.walk(root):
+        keep = []
+        for name in dirnames:
+            if name == "__pycache__":
+                shutil.rmtree(os.path.join(dirpath, name), ignore_errors=True)
+            elif name != ".git":
+                keep.append(name)
+        dirnames[:] = keep
+
+
 def checkout_and_reset(branch: str, reason: str = "unspecified",
                        unsynced_policy: str = "ignore") -> Tuple[bool, str]:
-    if _has_remote():
+    # Whether the target branch exists locally doesn't depend on the fetch or
+    # the unsynced-state checks below, so probe it concurrently with them.
+    branch_probe = _PROBE_POOL.submit(
+        git_capture, [*_GIT_RO, "rev-parse", "--verify", "--quiet", branch])
+
+    # Probe the remote once; the sync-state check below reuses the answer.
+    has_remote = _has_remote()
+    if has_remote:
         rc, _, err = git_capture(["git", "fetch", "origin"])
         if rc != 0:
             msg = f"git fetch failed: {err or 'unknown error'}"
-            append_jsonl(
-                DRIVE_ROOT / "logs" / "supervisor.jsonl",
+            _log_event(
                 {
                     "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
                     "type": "reset_fetch_failed",
@@ -339,7 +608,7 @@ def checkout_and_reset(branch: str, reason: str = "unspecified",
         policy = "ignore"
 
     if policy != "ignore":
-        repo_state = _collect_repo_sync_state()
+        repo_state = _collect_repo_sync_state(has_remote=has_remote)
         dirty_lines = list(repo_state.get("dirty_lines") or [])
         unpushed_lines = list(repo_state.get("unpushed_lines") or [])
         if dirty_lines or unpushed_lines:
@@ -359,14 +628,13 @@ def checkout_and_reset(branch: str, reason: str = "unspecified",
             rescue_suffix = ""
             rescue_path = str(rescue_info.get("path") or "").strip()
             if rescue_path:
-                rescue_suffix = f" Rescue saved to {rescue_path}."
+                rescue_suffix = f" Rescue saved to {rescue_path}{' (partial)' if rescue_info.get('partial') else ''}."
             elif policy in {"rescue_and_block", "rescue_and_reset"} and rescue_info.get("error"):
                 rescue_suffix = f" Rescue failed: {rescue_info.get('error')}."
 
             if policy in {"block", "rescue_and_block"}:
                 msg = f"Reset blocked ({detail}) to protect local changes.{rescue_suffix}"
-                append_jsonl(
-                    DRIVE_ROOT / "logs" / "supervisor.jsonl",
+                _log_event(
                     {
                         "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
                         "type": "reset_blocked_unsynced_state",
@@ -382,8 +650,7 @@ def checkout_and_reset(branch: str, reason: str = "unspecified",
                 )
                 return False, msg
 
-            append_jsonl(
-                DRIVE_ROOT / "logs" / "supervisor.jsonl",
+            _log_event(
                 {
                     "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
                     "type": "reset_unsynced_rescued_then_reset",
@@ -411,29 +678,38 @@ def checkout_and_reset(branch: str, reason: str = "unspecified",
                 time.sleep(1)
         return subprocess.run(cmd, **kwargs)
 
-    rc_local = subprocess.run(
-        ["git", "rev-parse", "--verify", branch],
-        cwd=str(REPO_DIR), capture_output=True,
-    ).returncode
+    def _run_script_resilient(steps):
+        import time
+        for attempt in range(5):
+            rc, out, err = _git_script(steps)
+            if rc == 0:
+                return out
+            if attempt == 4:  # any step may have failed: report the whole fused script
+                raise subprocess.CalledProcessError(rc, " && ".join(map(shlex.join, steps)), output=out, stderr=err)
+            time.sleep(1)
+
+    rc_local = branch_probe.result()[0]
 
     if rc_local != 0:
-        _run_git_resilient(["git", "reset", "--hard", "HEAD"], cwd=str(REPO_DIR), check=True)
-        _run_git_resilient(["git", "clean", "-fd"], cwd=str(REPO_DIR), check=True)
+        _run_script_resilient([["git", "reset", "--hard", "HEAD"], ["git", "clean", "-fd"]])
         _run_git_resilient(["git", "checkout", "-b", branch], cwd=str(REPO_DIR), check=False)
+        head_sha = _run_script_resilient([["git", "rev-parse", "HEAD"]])
     else:
-        _run_git_resilient(["git", "checkout", branch], cwd=str(REPO_DIR), check=True)
-        _run_git_resilient(["git", "reset", "--hard", "HEAD"], cwd=str(REPO_DIR), check=True)
-
-    # Clean __pycache__ to prevent stale bytecode (git checkout may not update mtime)
-    for p in REPO_DIR.rglob("__pycache__"):
-        shutil.rmtree(p, ignore_errors=True)
+        # checkout + reset + rev-parse in a single process
+        head_sha = _run_script_resilient([
+            ["git", "checkout", "-q", branch],
+            ["git", "reset", "-q", "--hard", "HEAD"],
+            ["git", "rev-parse", "HEAD"],
+        ])
+
+    # Clean __pycache__ to prevent stale bytecode (git checkout may not update mtime);
+    # the walk overlaps the state write and is joined before returning.
+    pycache_cleanup = _PROBE_POOL.submit(_remove_pycache_dirs, REPO_DIR)
     st = load_state()
     st["current_branch"] = branch
-    st["current_sha"] = subprocess.run(
-        ["git", "rev-parse", "HEAD"], cwd=str(REPO_DIR),
-        capture_output=True, text=True, check=True,
-    ).stdout.strip()
+    st["current_sha"] = head_sha.strip()
     save_state(st)
+    pycache_cleanup.result()
     return True, "ok"
 
 
@@ -449,16 +725,38 @@ def sync_runtime_dependencies(reason: str) -> Tuple[bool, str]:
     req_path = REPO_DIR / "requirements.txt"
     cmd: List[str] = [sys.executable, "-m", "pip", "install", "-q"]
     source = ""
-    if req_path.exists():
+    try:
+        req_bytes: Optional[bytes] = req_path.read_bytes()
+    except FileNotFoundError:
+        req_bytes = None
+    if req_bytes is not None:
         cmd += ["-r", str(req_path)]
         source = f"requirements:{req_path}"
     else:
         cmd += ["openai>=1.0.0", "requests"]
         source = "fallback:minimal"
+
+    # A no-op pip run still resolves every requirement (seconds); skip it when
+    # the same spec was already installed successfully into this interpreter.
+    h = hashlib.blake2b(digest_size=16)
+    h.update(sys.executable.encode("utf-8", errors="replace") + b"\0")
+    h.update(req_bytes if req_bytes is not None else "\n".join(cmd).encode("utf-8"))
+    deps_hash = h.hexdigest()
+    if load_state().get("deps_sync_hash") == deps_hash:
+        _log_event(
+            {
+                "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "type": "deps_sync_skip", "reason": reason, "source": source,
+            },
+        )
+        return True, "cached"
+
     try:
         subprocess.run(cmd, cwd=str(REPO_DIR), check=True, timeout=120)
-        append_jsonl(
-            DRIVE_ROOT / "logs" / "supervisor.jsonl",
+        st = load_state()
+        st["deps_sync_hash"] = deps_hash
+        save_state(st)
+        _log_event(
             {
                 "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
                 "type": "deps_sync_ok", "reason": reason, "source": source,
@@ -467,8 +765,7 @@ def sync_runtime_dependencies(reason: str) -> Tuple[bool, str]:
         return True, source
     except Exception as e:
         msg = repr(e)
-        append_jsonl(
-            DRIVE_ROOT / "logs" / "supervisor.jsonl",
+        _log_event(
             {
                 "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
                 "type": "deps_sync_error", "reason": reason, "source": source, "error": msg,
@@ -512,6 +809,17 @@ def safe_restart(
         - If successful: (True, "OK: <branch>")
         - If failed: (False, "<error description>")
     """
+    try:
+        # One state.json load/write for the whole checkout/deps pipeline.
+        with state_session():
+            return _safe_restart(reason, unsynced_policy)
+    finally:
+        # Events are appended in the background; make sure they land before
+        # the caller tears the process down (os._exit skips atexit).
+        flush_event_log()
+
+
+def _safe_restart(reason: str, unsynced_policy: str) -> Tuple[bool, str]:
     # Try dev branch
     ok, err = checkout_and_reset(BRANCH_DEV, reason=reason, unsynced_policy=unsynced_policy)
     if not ok:
@@ -526,8 +834,7 @@ def safe_restart(
         return True, f"OK: {BRANCH_DEV}"
 
     # Dev branch failed import — log the failure and fall back to stable
-    append_jsonl(
-        DRIVE_ROOT / "logs" / "supervisor.jsonl",
+    _log_event(
         {
             "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
             "type": "safe_restart_dev_import_failed",
@@ -567,7 +874,7 @@ def safe_restart(
 def list_versions(max_count: int = 50) -> List[Dict[str, Any]]:
     """Return list of annotated git tags sorted newest-first."""
     rc, raw, _ = git_capture([
-        "git", "tag", "-l", "--sort=-creatordate",
+        *_GIT_RO, "tag", "-l", "--sort=-creatordate",
         "--format=%(refname:short)\t%(creatordate:iso-strict)\t%(subject)",
     ])
     if rc != 0 or not raw.strip():
@@ -587,7 +894,7 @@ def list_versions(max_count: int = 50) -> List[Dict[str, Any]]:
 def list_commits(max_count: int = 30) -> List[Dict[str, Any]]:
     """Return recent commits on current branch."""
     rc, raw, _ = git_capture([
-        "git", "log", f"--max-count={max_count}",
+        *_GIT_RO, "log", f"--max-count={max_count}",
         "--format=%H\t%h\t%ai\t%s",
     ])
     if rc != 0 or not raw.strip():
@@ -629,8 +936,7 @@ def rollback_to_version(tag_or_sha: str, reason: str = "manual_rollback") -> Tup
     st["current_sha"] = target_sha.strip()
     save_state(st)
 
-    append_jsonl(
-        DRIVE_ROOT / "logs" / "supervisor.jsonl",
+    _log_event(
         {
             "ts": datetime.datetime.now(datetime.timezone.utc).isoformat(),
             "type": "manual_rollback",
@@ -639,6 +945,7 @@ def rollback_to_version(tag_or_sha: str, reason: str = "manual_rollback") -> Tup
             "new_sha": st["current_sha"],
         },
     )
+    flush_event_log()
     return True, f"Rolled back to {tag_or_sha} ({st['current_sha'][:8]})"
 
 
@@ -6,14 +6,17 @@ Persistent state on local disk: load, save, atomic writes, file locks.
 
 from __future__ import annotations
 
+import contextlib
+import copy
 import datetime
 import json
 import logging
 import os
 import pathlib
+import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 log = logging.getLogger(__name__)
 
@@ -47,14 +50,37 @@ def atomic_write_text(path: pathlib.Path, content: str) -> None:
     tmp = path.with_name(f".{path.name}.tmp.{uuid.uuid4().hex}")
     fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        data = content.encode("utf-8")
-        os.write(fd, data)
+        view = memoryview(content.encode("utf-8"))
+        while view:
+            view = view[os.write(fd, view):]
         os.fsync(fd)
     finally:
         os.close(fd)
     os.replace(str(tmp), str(path))
 
 
+def write_synced(path: pathlib.Path, data: bytes) -> None:
+    """Write data and fsync it; no tmp+rename, the caller stages the directory."""
+    with open(path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def fsync_dir(path: pathlib.Path) -> None:
+    """Persist a directory's entries (best effort; not supported on Windows)."""
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def json_load_file(path: pathlib.Path) -> Optional[Dict[str, Any]]:
     try:
         if not path.exists():
@@ -191,7 +217,15 @@ def _save_state_unlocked(st: Dict[str, Any]) -> None:
     atomic_write_text(STATE_LAST_GOOD_PATH, payload)
 
 
+# Per-thread state session (see state_session); None outside a session.
+_session = threading.local()
+_MISSING = object()
+
+
 def load_state() -> Dict[str, Any]:
+    active = getattr(_session, "state", None)
+    if active is not None:
+        return copy.deepcopy(active)
     lock_fd = acquire_file_lock(STATE_LOCK_PATH)
     try:
         return _load_state_unlocked()
@@ -200,6 +234,11 @@ def load_state() -> Dict[str, Any]:
 
 
 def save_state(st: Dict[str, Any]) -> None:
+    active = getattr(_session, "state", None)
+    if active is not None:
+        active.clear()
+        active.update(copy.deepcopy(st))
+        return
     lock_fd = acquire_file_lock(STATE_LOCK_PATH)
     try:
         _save_state_unlocked(st)
@@ -207,6 +246,43 @@ def save_state(st: Dict[str, Any]) -> None:
         release_file_lock(STATE_LOCK_PATH, lock_fd)
 
 
+@contextlib.contextmanager
+def state_session() -> Iterator[None]:
+    """Coalesce load_state/save_state calls made by this thread into one write.
+
+    Inside the session load_state/save_state work on an in-memory copy. On exit
+    only the keys this thread changed are merged into a freshly loaded state and
+    saved once, so concurrent updates from other threads (e.g. budget) survive.
+    Nested sessions join the outer one.
+    """
+    if getattr(_session, "state", None) is not None:
+        yield
+        return
+    lock_fd = acquire_file_lock(STATE_LOCK_PATH)
+    try:
+        base = _load_state_unlocked()
+    finally:
+        release_file_lock(STATE_LOCK_PATH, lock_fd)
+    _session.state = copy.deepcopy(base)
+    try:
+        yield
+    finally:
+        final = _session.state
+        _session.state = None
+        changed = {k: v for k, v in final.items() if base.get(k, _MISSING) != v}
+        removed = [k for k in base if k not in final]
+        if changed or removed:
+            lock_fd = acquire_file_lock(STATE_LOCK_PATH)
+            try:
+                fresh = _load_state_unlocked()
+                fresh.update(changed)
+                for k in removed:
+                    fresh.pop(k, None)
+                _save_state_unlocked(fresh)
+            finally:
+                release_file_lock(STATE_LOCK_PATH, lock_fd)
+
+
 def init_state() -> Dict[str, Any]:
     """
     Initialize state at session start, capturing snapshots for budget drift detection.
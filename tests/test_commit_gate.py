@@ -16,7 +16,9 @@ Verifies (Phase 5):
 """
 import importlib
 import inspect
+import json
 import os
+import pathlib
 import sys
 
 import pytest
@@ -283,3 +285,125 @@ def test_version_sync_checks_architecture_md():
     source = inspect.getsource(agent_mod.OuroborosAgent._check_version_sync)
     assert "ARCHITECTURE" in source
     assert "architecture_version" in source
+
+
+def test_porcelain_v2_entries_render_short_form():
+    git_ops = _get_git_ops_module()
+    render = git_ops._porcelain_v2_entry
+    assert render("1 .M N... 100644 100644 100644 abc abc src/a.py") == " M src/a.py"
+    assert render("2 R. N... 100644 100644 100644 abc abc R100 new name.py\told.py") == "R  old.py -> new name.py"
+    assert render("? docs/notes.md") == "?? docs/notes.md"
+
+
+def test_only_read_only_git_queries_skip_close_fds():
+    """fetch/push may run ssh or credential helpers: they must not inherit fds."""
+    git_ops = _get_git_ops_module()
+    for cmd in (["git", "fetch", "origin"], ["git", "push", "origin", "main"]):
+        _, kwargs = git_ops._spawn_args(cmd)
+        assert kwargs.get("close_fds", True) is True
+    _, kwargs = git_ops._spawn_args([*git_ops._GIT_RO, "status", "--porcelain"])
+    if os.name == "posix" and git_ops.shutil.which("git"):
+        assert kwargs == {"close_fds": False}
+
+
+def _rescue_repo(tmp_path, monkeypatch):
+    import subprocess
+    git_ops = _get_git_ops_module()
+    repo, drive = tmp_path / "repo", tmp_path / "data"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / "a.txt").write_text("hello\n")
+    monkeypatch.setattr(git_ops, "REPO_DIR", repo)
+    monkeypatch.setattr(git_ops, "DRIVE_ROOT", drive)
+    return git_ops, drive
+
+
+def test_rescue_snapshot_publishes_and_cleans_staging(tmp_path, monkeypatch):
+    git_ops, drive = _rescue_repo(tmp_path, monkeypatch)
+    info = git_ops._create_rescue_snapshot("main", "test", {"current_branch": "main"})
+    rescue_dir = drive / "archive" / "rescue"
+    published = list(rescue_dir.iterdir())
+    assert [str(p) for p in published] == [info["path"]]
+    assert json.loads((published[0] / "rescue_meta.json").read_text())["reason"] == "test"
+    assert not (drive / "archive" / "rescue_staging").exists()
+
+
+def test_rescue_snapshot_failure_publishes_partial_copy(tmp_path, monkeypatch):
+    git_ops, drive = _rescue_repo(tmp_path, monkeypatch)
+
+    def boom(dest):
+        raise ValueError("copy failed")
+
+    monkeypatch.setattr(git_ops, "_copy_untracked_for_rescue", boom)
+    info = git_ops._create_rescue_snapshot("main", "test", {"unpushed_lines": ["abc one"]})
+    assert info["partial"] is True and "copy failed" in info["capture_error"]
+    published = drive / "archive" / "rescue" / pathlib.Path(info["path"]).name
+    assert (published / "status.porcelain.txt").read_text() == "?? a.txt\n"
+    assert json.loads((published / "rescue_meta.json").read_text())["partial"] is True
+    assert not (drive / "archive" / "rescue_staging").exists()
+
+
+def test_rescue_snapshot_reports_failed_publish(tmp_path, monkeypatch):
+    git_ops, drive = _rescue_repo(tmp_path, monkeypatch)
+
+    def no_replace(src, dst):
+        raise OSError("rename refused")
+
+    monkeypatch.setattr(git_ops.os, "replace", no_replace)
+    with pytest.raises(RuntimeError, match="not published: rename refused"):
+        git_ops._create_rescue_snapshot("main", "test", {})
+
+
+def test_untracked_copy_survives_chatty_git_stderr(tmp_path, monkeypatch):
+    import threading
+    git_ops, _ = _rescue_repo(tmp_path, monkeypatch)
+    script = ("import sys; sys.stderr.write('warning: x\\n' * 200000); sys.stderr.flush(); "
+              "sys.stdout.write('a.txt\\0')")
+    monkeypatch.setattr(git_ops, "_spawn_args", lambda cmd: ([sys.executable, "-c", script], {}))
+    result = {}
+    worker = threading.Thread(
+        target=lambda: result.update(git_ops._copy_untracked_for_rescue(tmp_path / "out")), daemon=True)
+    worker.start()
+    worker.join(30)
+    assert not worker.is_alive(), "blocked on a full stderr pipe"
+    assert result["copied_files"] == 1 and "error" not in result
+
+
+def test_untracked_cache_config_written_only_when_missing(tmp_path, monkeypatch):
+    git_ops, _ = _rescue_repo(tmp_path, monkeypatch)
+    monkeypatch.setattr(git_ops, "_ensure_local_version_tag", lambda: None)
+    calls = []
+    real = git_ops.git_capture
+    monkeypatch.setattr(git_ops, "git_capture", lambda cmd: calls.append(cmd) or real(cmd))
+
+    git_ops.ensure_repo_present()
+    writes = [c for c in calls if c[-2:] == ["core.untrackedCache", "true"]]
+    assert len(writes) == 1
+    calls.clear()
+    git_ops.ensure_repo_present()
+    assert not [c for c in calls if c[-2:] == ["core.untrackedCache", "true"]]
+
+
+def test_deps_sync_skips_pip_until_requirements_or_interpreter_change(tmp_path, monkeypatch):
+    git_ops = _get_git_ops_module()
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    state, pip_runs = {}, []
+    monkeypatch.setattr(git_ops, "REPO_DIR", tmp_path)
+    monkeypatch.setattr(git_ops, "load_state", lambda: dict(state))
+    monkeypatch.setattr(git_ops, "save_state", state.update)
+    monkeypatch.setattr(git_ops, "_log_event", lambda event: None)
+    monkeypatch.setattr(git_ops.subprocess, "run", lambda cmd, **kw: pip_runs.append(cmd))
+
+    assert git_ops.sync_runtime_dependencies("boot") == (True, f"requirements:{tmp_path / 'requirements.txt'}")
+    assert git_ops.sync_runtime_dependencies("restart") == (True, "cached")
+    assert len(pip_runs) == 1
+
+    (tmp_path / "requirements.txt").write_text("requests\nopenai\n")
+    assert git_ops.sync_runtime_dependencies("restart")[1] != "cached"
+    assert git_ops.sync_runtime_dependencies("restart") == (True, "cached")
+    assert len(pip_runs) == 2
+
+    monkeypatch.setattr(git_ops.sys, "executable", "/other/venv/bin/python")
+    assert git_ops.sync_runtime_dependencies("restart")[1] != "cached"
+    assert len(pip_runs) == 3 and pip_runs[-1][0] == "/other/venv/bin/python"
+
@@ -0,0 +1,51 @@
+"""Tests for supervisor/events.py _handle_promote_to_stable remote push."""
+
+import subprocess
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+def _promote_ctx(repo):
+    class FakeCtx:
+        REPO_DIR = repo
+        BRANCH_DEV = "ouroboros"
+        BRANCH_STABLE = "ouroboros-stable"
+        sent = []
+
+        def load_state(self):
+            return {"owner_chat_id": 1}
+
+        def send_with_budget(self, chat_id, text):
+            self.sent.append(text)
+
+    return FakeCtx()
+
+
+def test_promote_pushes_then_skips_when_origin_has_sha(tmp_path):
+    from supervisor import events as ev_module
+
+    origin, repo = tmp_path / "origin.git", tmp_path / "repo"
+    _git(tmp_path, "init", "-q", "--bare", str(origin))
+    _git(tmp_path, "init", "-q", "-b", "ouroboros", str(repo))
+    _git(repo, "commit", "-q", "--allow-empty", "-m", "one")
+    _git(repo, "remote", "add", "origin", str(origin))
+    ctx = _promote_ctx(repo)
+
+    ev_module._handle_promote_to_stable({}, ctx)
+    sha = _git(repo, "rev-parse", "ouroboros")
+    assert ctx.sent[-1].endswith(f"({sha[:8]}) (pushed to origin)")
+    assert _git(origin, "rev-parse", "ouroboros-stable") == sha
+
+    # A push attempt would now fail; the skip never reaches the network.
+    _git(repo, "remote", "set-url", "origin", str(tmp_path / "missing.git"))
+    ev_module._handle_promote_to_stable({}, ctx)
+    assert ctx.sent[-1].endswith(f"({sha[:8]}) (origin already up to date)")
+
+    _git(repo, "commit", "-q", "--allow-empty", "-m", "two")
+    ev_module._handle_promote_to_stable({}, ctx)
+    assert ctx.sent[-1].endswith(f"({_git(repo, 'rev-parse', 'ouroboros')[:8]})")  # push tried, failed
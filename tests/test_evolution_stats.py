@@ -0,0 +1,173 @@
+"""Evolution stats: background push state and GitHub push memo."""
+import base64
+import json
+import os
+import threading
+
+import pytest
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork-only behaviour")
+def test_forked_child_gets_fresh_push_state():
+    from ouroboros.tools import evolution_stats as es
+
+    es._PUSH_EXECUTOR.submit(lambda: None).result()  # parent's worker thread exists
+    es._PUSH_INFLIGHT.set()
+    es._GH_SESSION = object()
+    parent_executor = es._PUSH_EXECUTOR
+    try:
+        pid = os.fork()
+        if pid == 0:
+            ok = (es._PUSH_EXECUTOR is not parent_executor
+                  and not es._PUSH_INFLIGHT.is_set()
+                  and es._PUSH_PENDING is None
+                  and es._GH_SESSION is None
+                  and es._PUSH_EXECUTOR.submit(lambda: 42).result(timeout=5) == 42)
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert es._PUSH_INFLIGHT.is_set()  # parent state untouched
+    finally:
+        es._PUSH_INFLIGHT.clear()
+        es._GH_SESSION = None
+
+
+@pytest.fixture
+def push_state(monkeypatch):
+    from ouroboros.tools import evolution_stats as es
+
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    es._reset_push_state()
+    yield es
+    es._PUSH_EXECUTOR.shutdown(wait=True)
+    es._reset_push_state()
+
+
+def _drained(es):
+    es._PUSH_EXECUTOR.submit(lambda: None).result(timeout=5)  # single worker: runs after the drain
+
+
+def test_pushes_coalesce_to_latest_payload(push_state, monkeypatch):
+    es = push_state
+    release = threading.Event()
+    pushed = []
+
+    def fake_push(data):
+        release.wait(5)
+        pushed.append(data["n"])
+        return "pushed"
+
+    monkeypatch.setattr(es, "_push_to_github", fake_push)
+    assert "queued" in es._schedule_push({"n": 1})
+    assert "coalesced" in es._schedule_push({"n": 2})
+    assert "coalesced" in es._schedule_push({"n": 3})
+    release.set()
+    _drained(es)
+    assert pushed in ([1, 3], [3])  # 2 was replaced before it was picked up
+    assert not es._PUSH_INFLIGHT.is_set()
+
+
+def test_background_push_error_reported_on_next_call(push_state, monkeypatch):
+    es = push_state
+    monkeypatch.setattr(es, "_push_to_github", lambda data: "error: 401 — Bad credentials")
+    assert "last push" not in es._schedule_push({"points": []})
+    _drained(es)
+    assert "(last push: error: 401 — Bad credentials)" in es._schedule_push({"points": []})
+    _drained(es)
+
+    def boom(data):
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(es, "_push_to_github", boom)
+    es._schedule_push({"points": []})
+    _drained(es)
+    assert "last push: error: RuntimeError: connection reset" in es._schedule_push({"points": []})
+
+
+class _Resp:
+    def __init__(self, status, body=None, headers=None):
+        self.status_code = status
+        self._body = body or {}
+        self.headers = headers or {}
+        self.text = json.dumps(self._body)
+
+    def json(self):
+        return self._body
+
+
+class _FakeSession:
+    def __init__(self, gets=(), puts=()):
+        self.gets, self.puts = list(gets), list(puts)
+        self.get_calls, self.put_calls = [], []
+
+    def get(self, url, headers=None, timeout=None):
+        self.get_calls.append(dict(headers or {}))
+        return self.gets.pop(0)
+
+    def put(self, url, json=None, timeout=None):
+        self.put_calls.append(json)
+        return self.puts.pop(0)
+
+
+@pytest.fixture
+def gh(monkeypatch):
+    from ouroboros.tools import evolution_stats as es
+
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setenv("GITHUB_USER", "u")
+    monkeypatch.setenv("GITHUB_REPO", "r")
+    monkeypatch.setattr(es, "_PUSH_CACHE", {})
+    session = _FakeSession()
+    monkeypatch.setattr(es, "_github_session", lambda token: session)
+    return es, session
+
+
+def _data(stamp="2026-01-01T00:00:00Z", n=2):
+    return {"generated_at": stamp, "points": [{"hash": str(i)} for i in range(n)]}
+
+
+def _put_ok(sha):
+    return _Resp(201, {"content": {"sha": sha}})
+
+
+def test_unchanged_content_skips_put(gh):
+    es, session = gh
+    session.gets = [_Resp(200, {"sha": "s0"}, {"ETag": '"e0"'})]
+    session.puts = [_put_ok("s1")]
+    assert es._push_to_github(_data()).startswith("pushed 2 points")
+    # only generated_at differs: no GET, no PUT
+    assert es._push_to_github(_data(stamp="2026-02-02T00:00:00Z")).startswith("unchanged")
+    assert len(session.get_calls) == 1 and len(session.put_calls) == 1
+    assert session.put_calls[0]["sha"] == "s0"
+    pushed = json.loads(base64.b64decode(session.put_calls[0]["content"]))
+    assert pushed == _data()
+
+
+def test_stale_sha_refetches_and_retries_once(gh):
+    es, session = gh
+    session.gets = [_Resp(200, {"sha": "s0"}, {"ETag": '"e0"'}),
+                    _Resp(200, {"sha": "remote"}, {"ETag": '"e1"'})]
+    session.puts = [_put_ok("s1"), _Resp(409, {"message": "conflict"}), _put_ok("s2")]
+    es._push_to_github(_data(n=1))
+    assert es._push_to_github(_data(n=2)).startswith("pushed 2 points")
+    assert [p.get("sha") for p in session.put_calls] == ["s0", "s1", "remote"]
+    assert session.get_calls[1] == {"If-None-Match": '"e0"'}
+
+
+def test_second_conflict_is_reported_not_retried(gh):
+    es, session = gh
+    session.gets = [_Resp(200, {"sha": "s0"}), _Resp(200, {"sha": "s0"})]
+    session.puts = [_put_ok("s1"), _Resp(422, {"m": "a"}), _Resp(422, {"m": "b"})]
+    es._push_to_github(_data(n=1))
+    assert es._push_to_github(_data(n=2)).startswith("error: 422")
+    assert len(session.put_calls) == 3
+
+
+def test_not_modified_reuses_cached_sha(gh):
+    es, session = gh
+    session.gets = [_Resp(200, {"sha": "s0"}, {"ETag": '"e0"'}), _Resp(304)]
+    session.puts = [_Resp(500, {"m": "boom"}), _put_ok("s1")]
+    assert es._push_to_github(_data(n=1)).startswith("error: 500")
+    assert es._push_to_github(_data(n=1)).startswith("pushed 1 points")
+    assert session.get_calls == [{}, {"If-None-Match": '"e0"'}]
+    assert session.put_calls[1]["sha"] == "s0"
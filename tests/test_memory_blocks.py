@@ -133,3 +133,108 @@ class TestCacheHitRate:
         )
         rate = _compute_cache_hit_rate(env)
         assert rate is None
+
+
+class TestJsonlTail:
+    def test_tail_spans_multiple_chunks(self, tmp_path):
+        from ouroboros.utils import tail_lines
+
+        path = tmp_path / "log.jsonl"
+        path.write_text("".join(f'{{"i": {i}, "pad": "{"x" * 40}"}}\n' for i in range(500)))
+        lines = tail_lines(path, 120, chunk_size=256)
+        assert len(lines) == 120
+        assert [json.loads(ln)["i"] for ln in lines] == list(range(380, 500))
+
+    def test_tail_skips_blank_lines_and_short_files(self, tmp_path):
+        from ouroboros.utils import tail_lines
+
+        path = tmp_path / "log.jsonl"
+        path.write_text('{"i": 1}\n\n{"i": 2}\n\n')
+        assert tail_lines(path, 10) == ['{"i": 1}', '{"i": 2}']
+        assert tail_lines(path, 0) == []
+
+    def test_tail_long_lines_many_lines_stays_linear(self, tmp_path, monkeypatch):
+        import sys
+        from ouroboros.utils import tail_lines
+
+        path = tmp_path / "log.jsonl"
+        long_line = "x" * 50_000
+        short = "".join(f'{{"i": {i}}}\n' for i in range(20_000))
+        path.write_text("".join(f"{i}{long_line}\n" for i in range(100)) + short)
+        size = path.stat().st_size
+
+        # Count bytes read from the file and bytes.split passes over the buffer:
+        # each byte should be read once and the buffer split O(log n) times,
+        # not once per chunk.
+        stats = {"read": 0, "splits": 0}
+        real_open = pathlib.Path.open
+
+        def counting_open(self, *args, **kwargs):
+            f = real_open(self, *args, **kwargs)
+            real_read = f.read
+
+            def read(*a):
+                data = real_read(*a)
+                stats["read"] += len(data)
+                return data
+
+            f.read = read
+            return f
+
+        def profile(frame, event, arg):
+            if event == "c_call" and arg.__name__ == "split" and type(getattr(arg, "__self__", None)) is bytes:
+                stats["splits"] += 1
+
+        def run(n):
+            stats.update(read=0, splits=0)
+            sys.setprofile(profile)
+            try:
+                return tail_lines(path, n)
+            finally:
+                sys.setprofile(None)
+
+        monkeypatch.setattr(pathlib.Path, "open", counting_open)
+        lines = run(1000)
+        assert [json.loads(ln)["i"] for ln in lines] == list(range(19_000, 20_000))
+        assert stats["read"] <= 65536 and stats["splits"] == 1
+
+        lines = run(20_100)
+        assert len(lines) == 20_100
+        assert lines[99].startswith("99x") and len(lines[0]) == 50_001
+        assert stats["read"] == size and stats["splits"] == 1
+
+    def test_tail_refills_after_blank_lines(self, tmp_path):
+        from ouroboros.utils import tail_lines
+
+        path = tmp_path / "log.jsonl"
+        path.write_text('{"i": 0}\n' + "\n" * 5000 + '{"i": 1}\n\n\n')
+        assert tail_lines(path, 2, chunk_size=64) == ['{"i": 0}', '{"i": 1}']
+
+    def test_chat_history_pages_deep_with_offset(self, memory):
+        path = memory.logs_path("chat.jsonl")
+        path.write_text("".join(
+            json.dumps({"ts": "2025-01-01T00:00", "direction": "in", "text": f"msg-{i}"}) + "\n"
+            for i in range(20_000)
+        ))
+        out = memory.chat_history(count=3, offset=15_000)
+        assert out.startswith("Showing 3 messages:")
+        assert "msg-4997" in out and "msg-4999" in out
+        assert "msg-4996" not in out and "msg-5000" not in out
+        assert memory.chat_history(count=5, offset=20_000) == "(no messages matching query)"
+
+    def test_chat_history_page_skips_unparseable_lines(self, memory):
+        path = memory.logs_path("chat.jsonl")
+        path.write_text("".join(
+            json.dumps({"ts": "2025-01-01T00:00", "direction": "in", "text": f"msg-{i}"}) + "\nnot json\n{broken\n"
+            for i in range(30)
+        ))
+        out = memory.chat_history(count=5, offset=10)
+        assert out.startswith("Showing 5 messages:")
+        assert [f"msg-{i}" in out for i in range(14, 21)] == [False] + [True] * 5 + [False]
+        assert memory.chat_history(count=5, offset=28).startswith("Showing 2 messages:")
+
+    def test_read_jsonl_tail_returns_last_entries(self, memory):
+        path = memory.logs_path("events.jsonl")
+        path.write_text("\n".join(json.dumps({"n": i}) for i in range(50)) + "\nnot json\n")
+        entries = memory.read_jsonl_tail("events.jsonl", 5)
+        assert [e["n"] for e in entries] == [46, 47, 48, 49]
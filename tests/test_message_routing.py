@@ -70,6 +70,23 @@ class TestOwnerInjectPerTask(unittest.TestCase):
         cleanup_task_mailbox(self.drive_root, "t1")
         self.assertFalse(path.exists())
 
+    def test_clear_stale_mailboxes_keeps_restored_tasks(self):
+        from ouroboros.owner_inject import (
+            write_owner_message, clear_stale_mailboxes, drain_owner_messages, get_pending_path,
+        )
+        write_owner_message(self.drive_root, "keep me", task_id="t1", msg_id="m1")
+        write_owner_message(self.drive_root, "stale", task_id="t2", msg_id="m2")
+        get_pending_path(self.drive_root).write_text("{}\n")
+
+        clear_stale_mailboxes(self.drive_root, keep_task_ids=["t1"])
+        self.assertEqual(drain_owner_messages(self.drive_root, task_id="t1"), ["keep me"])
+        self.assertEqual(drain_owner_messages(self.drive_root, task_id="t2"), [])
+        self.assertFalse(get_pending_path(self.drive_root).exists())
+
+        clear_stale_mailboxes(self.drive_root)
+        self.assertEqual(drain_owner_messages(self.drive_root, task_id="t1"), [])
+        self.assertTrue((self.drive_root / "memory" / "owner_mailbox").is_dir())
+
     def test_drain_nonexistent_task_returns_empty(self):
         from ouroboros.owner_inject import drain_owner_messages
         msgs = drain_owner_messages(self.drive_root, task_id="nonexistent")
@@ -6,6 +6,7 @@ from ouroboros.config import (
     resolve_effort,
     get_review_models,
     get_review_enforcement,
+    parse_budget,
 )
 
 
@@ -156,3 +157,12 @@ def test_apply_settings_to_env_includes_effort_keys():
               "OUROBOROS_EFFORT_REVIEW", "OUROBOROS_EFFORT_CONSCIOUSNESS",
               "OUROBOROS_REVIEW_MODELS", "OUROBOROS_REVIEW_ENFORCEMENT"):
         os.environ.pop(k, None)
+
+
+def test_parse_budget_tolerates_currency_noise():
+    assert parse_budget(25) == 25.0
+    assert parse_budget("$12.5") == 12.5
+    assert parse_budget("30 USD") == 30.0
+    assert parse_budget(None) == 10.0
+    assert parse_budget("") == 10.0
+    assert parse_budget("lots", default=3.0) == 3.0
@@ -0,0 +1,66 @@
+"""Tests for supervisor/state.py state_session merge-on-exit."""
+
+import json
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def state(tmp_path, monkeypatch):
+    from supervisor import state as state_mod
+
+    monkeypatch.setattr(state_mod, "STATE_PATH", tmp_path / "state" / "state.json")
+    monkeypatch.setattr(state_mod, "STATE_LAST_GOOD_PATH", tmp_path / "state" / "state.last_good.json")
+    monkeypatch.setattr(state_mod, "STATE_LOCK_PATH", tmp_path / "locks" / "state.lock")
+    st = state_mod.load_state()
+    st.update(kept="base", doomed="base")
+    state_mod.save_state(st)
+    return state_mod
+
+
+def _on_disk(state_mod):
+    return json.loads(state_mod.STATE_PATH.read_text(encoding="utf-8"))
+
+
+def _other_writer(state_mod, **updates):
+    """Write from another thread, i.e. outside this thread's session."""
+    def run():
+        st = state_mod.load_state()
+        st.update(updates)
+        state_mod.save_state(st)
+
+    t = threading.Thread(target=run)
+    t.start()
+    t.join()
+
+
+def test_session_merge_keeps_concurrent_writes(state):
+    with state.state_session():
+        st = state.load_state()
+        st["mine"] = 1
+        del st["doomed"]
+        state.save_state(st)
+        _other_writer(state, theirs=2, kept="theirs")
+        assert "mine" not in _on_disk(state)  # nothing written until exit
+
+    disk = _on_disk(state)
+    assert disk["mine"] == 1 and "doomed" not in disk
+    assert disk["theirs"] == 2
+    assert disk["kept"] == "theirs"  # read but unchanged in the session: not overwritten
+
+
+def test_nested_session_joins_outer(state):
+    with state.state_session():
+        with state.state_session():
+            st = state.load_state()
+            st["inner"] = "x"
+            state.save_state(st)
+        assert "inner" not in _on_disk(state)
+        assert state.load_state()["inner"] == "x"
+        st = state.load_state()
+        st["outer"] = "y"
+        state.save_state(st)
+
+    disk = _on_disk(state)
+    assert disk["inner"] == "x" and disk["outer"] == "y"